@@ -0,0 +1,122 @@
+"""
+Compares the python-docx DOCX renderer with the raw OOXML fast path.
+
+Parity is checked by reading both outputs back with python-docx: the sequence of
+body paragraphs and tables, their text, styles, alignment and run formatting
+must match. Then both renderers are timed, including peak traced allocations.
+
+Usage (from backend/):
+    python -m benchmarks.bench_docx_renderers [--iterations 50]
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import docx
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+
+from benchmarks.sample_resume import sample_resume
+from services.docx_ooxml import generate_docx_resume_ooxml
+from services.generator import generate_docx_resume
+from services.resume_ir import build_resume_ir
+
+RENDERERS = {
+    "python-docx": generate_docx_resume,
+    "ooxml": generate_docx_resume_ooxml,
+}
+
+
+def describe_paragraph(p: Paragraph) -> tuple:
+    fmt = p.paragraph_format
+    runs = tuple((r.text, bool(r.bold), bool(r.italic), r.font.size) for r in p.runs if r.text)
+    return ("p", p.style.name, p.alignment, fmt.space_before, fmt.space_after, fmt.left_indent, runs)
+
+
+def describe(path: str) -> list:
+    """Flattens the document body into comparable tuples, in order."""
+    document = docx.Document(path)
+    out = []
+    for block in document.element.body.iterchildren():
+        tag = block.tag.rsplit('}', 1)[-1]
+        if tag == "p":
+            out.append(describe_paragraph(Paragraph(block, document)))
+        elif tag == "tbl":
+            table = Table(block, document)
+            out.append(("tbl", tuple(
+                tuple(describe_paragraph(c.paragraphs[0]) for c in row.cells) for row in table.rows
+            )))
+    section = document.sections[0]
+    out.append(("section", section.page_width, section.page_height,
+                section.left_margin, section.right_margin, section.top_margin, section.bottom_margin))
+    return out
+
+
+def check_parity(data: dict, tmp_dir: str, label: str) -> bool:
+    described = {}
+    for name, render in RENDERERS.items():
+        path = os.path.join(tmp_dir, f"{label}_{name}.docx")
+        render(data, path)
+        described[name] = describe(path)
+
+    expected, actual = described["python-docx"], described["ooxml"]
+    ok = expected == actual
+    print(f"parity[{label}]: {len(expected)} blocks -> {'OK' if ok else 'FAIL'}")
+    if not ok:
+        for i, (e, a) in enumerate(zip(expected, actual)):
+            if e != a:
+                print(f"  first difference at block {i}:\n    python-docx: {e}\n    ooxml:       {a}")
+                break
+        else:
+            print(f"  block counts differ: {len(expected)} vs {len(actual)}")
+    return ok
+
+
+def bench(data: dict, iterations: int, tmp_dir: str):
+    ir = build_resume_ir(data)
+    timings = {}
+    for name, render in RENDERERS.items():
+        path = os.path.join(tmp_dir, f"bench_{name}.docx")
+        render(ir, path)  # warm up
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            render(ir, path)
+        timings[name] = (time.perf_counter() - start) / iterations * 1000
+
+        tracemalloc.start()
+        render(ir, path)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{name:>12}: {timings[name]:.2f} ms/render, peak alloc {peak / 1024:.0f} KiB, "
+              f"{os.path.getsize(path) / 1024:.1f} KiB file")
+    print(f"     speedup: {timings['python-docx'] / timings['ooxml']:.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    one_page = sample_resume()
+    multi_page = sample_resume(roles=10, bullets=8, projects=6)
+    # Entries without dates/roles and skills without a category take the single-line paths
+    edge_cases = dict(one_page, education=["Self taught"], experience=["Freelance\n- Built sites"],
+                      skills=["Python, Go"], summary="")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        ok = all([check_parity(one_page, tmp_dir, "one_page"),
+                  check_parity(multi_page, tmp_dir, "multi_page"),
+                  check_parity(edge_cases, tmp_dir, "edge_cases")])
+        print(f"\n{args.iterations} iterations, one-page resume:")
+        bench(one_page, args.iterations, tmp_dir)
+        print(f"\n{args.iterations} iterations, multi-page resume:")
+        bench(multi_page, args.iterations, tmp_dir)
+
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
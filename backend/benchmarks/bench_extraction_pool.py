@@ -0,0 +1,227 @@
+"""
+Throughput and robustness benchmark for the isolated extraction pool.
+
+Builds adversarial fixtures on the fly (truncated PDF, random bytes, a PDF whose
+content stream inflates to hundreds of MB, a DOCX whose document.xml does the
+same) and checks that each one ends as text, "" or a clean ExtractionError
+within the timeout, and that the pool keeps serving afterwards. A second,
+single-worker pool without a memory limit runs a slow but valid PDF to check
+each failure path by its message: the task timeout, a worker killed mid-task,
+and callers turned away while the worker is busy. Then compares throughput
+against in-process extraction.
+
+Usage (from backend/):
+    python -m benchmarks.bench_extraction_pool [--docs 200] [--workers 4]
+"""
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.sample_resume import sample_resume
+from services.extraction_pool import ExtractionBusyError, ExtractionError, ExtractionPool
+from services.generator import generate_pdf_resume
+from services.parser import extract_document
+
+CHUNK = b"\0" * (1024 * 1024)
+
+
+# --- Adversarial fixtures ---
+
+def write_valid_pdf(path: str):
+    generate_pdf_resume(sample_resume(), path)
+
+
+def write_slow_pdf(path: str):
+    """Valid resume long enough (~70 pages) to keep a worker busy for several seconds."""
+    generate_pdf_resume(sample_resume(roles=200, bullets=8, projects=0), path)
+
+
+def write_truncated_pdf(path: str, valid_path: str):
+    with open(valid_path, "rb") as f:
+        data = f.read()
+    with open(path, "wb") as f:
+        f.write(data[: len(data) // 2])
+
+
+def write_random_bytes(path: str):
+    with open(path, "wb") as f:
+        f.write(b"%PDF-1.4\n" + random.Random(0).randbytes(64 * 1024))
+
+
+def write_pdf_bomb(path: str, inflated_mb: int):
+    """Single page whose FlateDecode content stream inflates to `inflated_mb` MB."""
+    comp = zlib.compressobj(9)
+    stream = b"".join(comp.compress(CHUNK) for _ in range(inflated_mb)) + comp.flush()
+
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R >>",
+        b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(stream) + stream + b"\nendstream",
+    ]
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for i, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % i + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % off for off in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    with open(path, "wb") as f:
+        f.write(out)
+
+
+def write_docx_bomb(path: str, inflated_mb: int):
+    """Valid DOCX package whose document.xml holds `inflated_mb` MB of tiny paragraphs."""
+    para = b"<w:p><w:r><w:t>a</w:t></w:r></w:p>" * (1024 * 1024 // 35)
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml",
+                    '<?xml version="1.0"?><Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                    '<Default Extension="xml" ContentType="application/xml"/>'
+                    '<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+                    '</Types>')
+        zf.writestr("_rels/.rels",
+                    '<?xml version="1.0"?><Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>'
+                    '</Relationships>')
+        with zf.open("word/document.xml", "w", force_zip64=True) as f:
+            f.write(b'<?xml version="1.0"?><w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>')
+            for _ in range(inflated_mb):
+                f.write(para)
+            f.write(b"</w:body></w:document>")
+
+
+def build_fixtures(tmp_dir: str, bomb_mb: int) -> dict:
+    paths = {name: os.path.join(tmp_dir, name) for name in
+             ["valid.pdf", "truncated.pdf", "random.pdf", "bomb.pdf", "bomb.docx", "slow.pdf"]}
+    write_valid_pdf(paths["valid.pdf"])
+    write_truncated_pdf(paths["truncated.pdf"], paths["valid.pdf"])
+    write_slow_pdf(paths["slow.pdf"])
+    write_random_bytes(paths["random.pdf"])
+    write_pdf_bomb(paths["bomb.pdf"], bomb_mb)
+    write_docx_bomb(paths["bomb.docx"], bomb_mb)
+    return paths
+
+
+# --- Checks ---
+
+def run_fixture(pool: ExtractionPool, name: str, path: str) -> bool:
+    start = time.perf_counter()
+    try:
+        document = pool.extract(path, name)
+        outcome = f"{len(document.text)} chars, {len(document.sections)} sections"
+    except ExtractionError as e:
+        outcome = f"ExtractionError: {e}"
+    elapsed = time.perf_counter() - start
+    # Anything that returns or fails cleanly within the timeout (plus respawn slack) is a pass
+    ok = elapsed < pool.timeout + 5
+    print(f"  {name:>14}: {outcome:<60} {elapsed:6.2f}s {'OK' if ok else 'FAIL'}")
+    return ok
+
+
+def expect_error(name: str, call, error: type, message: str) -> bool:
+    """Runs call() and checks it raises `error` whose message contains `message`."""
+    start = time.perf_counter()
+    try:
+        call()
+        outcome = "returned a document"
+        ok = False
+    except ExtractionError as e:
+        outcome = f"{type(e).__name__}: {e}"
+        ok = isinstance(e, error) and message in str(e)
+    elapsed = time.perf_counter() - start
+    print(f"  {name:>14}: {outcome:<60} {elapsed:6.2f}s {'OK' if ok else f'FAIL (expected {message!r})'}")
+    return ok
+
+
+def run_failure_paths(pool: ExtractionPool, slow_path: str) -> bool:
+    """Single-worker pool, no memory limit: every failure below must come from the path under test."""
+    ok = expect_error("timeout", lambda: pool.extract(slow_path, "slow.pdf", timeout=1),
+                      ExtractionError, "timed out after 1s")
+
+    def killer():
+        time.sleep(0.5)
+        for worker in list(pool._all):
+            worker.process.kill()
+
+    threading.Thread(target=killer, daemon=True).start()
+    ok &= expect_error("killed worker", lambda: pool.extract(slow_path, "slow.pdf"),
+                       ExtractionError, "worker died (exit code -9)")
+
+    # Hold the only worker, then queue one caller past queue_timeout and one past max_waiting
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        busy = ex.submit(pool.extract, slow_path, "slow.pdf")
+        time.sleep(0.2)
+        results = []
+        waiter = threading.Thread(target=lambda: results.append(expect_error(
+            "queue timeout", lambda: pool.extract(slow_path, "slow.pdf"), ExtractionBusyError, "No extraction worker free")))
+        waiter.start()
+        time.sleep(0.1)
+        ok &= expect_error("queue full", lambda: pool.extract(slow_path, "slow.pdf"),
+                           ExtractionBusyError, "All extraction workers busy")
+        waiter.join()
+        ok &= all(results)
+        ok &= bool(busy.result().text)
+    return ok
+
+
+def throughput(pool: ExtractionPool, path: str, docs: int) -> float:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=pool.workers) as ex:
+        list(ex.map(lambda _: pool.extract(path, "valid.pdf"), range(docs)))
+    return docs / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument("--memory-limit-mb", type=int, default=512)
+    parser.add_argument("--max-tasks", type=int, default=50)
+    parser.add_argument("--bomb-mb", type=int, default=1024, help="inflated size of the bomb fixtures")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        print("Building fixtures...")
+        fixtures = build_fixtures(tmp_dir, args.bomb_mb)
+
+        pool = ExtractionPool(args.workers, args.timeout, args.memory_limit_mb, args.max_tasks).start()
+        try:
+            print(f"\nAdversarial fixtures ({args.workers} workers, {args.timeout:g}s timeout, "
+                  f"{args.memory_limit_mb} MB limit):")
+            ok = all([run_fixture(pool, name, path) for name, path in fixtures.items()])
+            ok &= run_fixture(pool, "valid.pdf", fixtures["valid.pdf"])  # pool still healthy
+
+            print(f"\nThroughput, {args.docs} valid PDFs:")
+            start = time.perf_counter()
+            for _ in range(args.docs):
+                extract_document(fixtures["valid.pdf"], "valid.pdf")
+            print(f"  in-process (sequential): {args.docs / (time.perf_counter() - start):7.1f} docs/s")
+            print(f"  pool ({args.workers} workers, recycle every {args.max_tasks}): "
+                  f"{throughput(pool, fixtures['valid.pdf'], args.docs):7.1f} docs/s")
+        finally:
+            pool.shutdown()
+
+        # Generous task timeout so only the checks that pass their own timeout can time out
+        failure_pool = ExtractionPool(1, 120, 0, args.max_tasks, max_waiting=1, queue_timeout=0.5).start()
+        try:
+            print("\nFailure paths (1 worker, no memory limit, slow valid PDF):")
+            ok &= run_failure_paths(failure_pool, fixtures["slow.pdf"])
+            ok &= run_fixture(failure_pool, "valid.pdf", fixtures["valid.pdf"])  # respawned worker serves
+        finally:
+            failure_pool.shutdown()
+
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
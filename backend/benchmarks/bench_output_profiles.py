@@ -0,0 +1,84 @@
+"""
+Compares the standard and compact output profiles for every renderer.
+
+For each renderer and profile: output size and mean render time. Checks that
+compact output is byte-identical across two renders made --gap seconds apart
+(past the 1s PDF date and 2s zip timestamp resolution), and that both profiles
+carry the same content (PDF: extracted words; DOCX: python-docx readback).
+
+Usage (from backend/):
+    python -m benchmarks.bench_output_profiles [--iterations 20] [--gap 2.1]
+"""
+import argparse
+import hashlib
+import os
+import tempfile
+import time
+
+from benchmarks.bench_docx_renderers import describe
+from benchmarks.bench_pdf_renderers import words
+from benchmarks.sample_resume import sample_resume
+from services.docx_ooxml import generate_docx_resume_ooxml
+from services.generator import generate_docx_resume, generate_pdf_resume
+from services.output_profile import COMPACT, OUTPUT_PROFILES
+from services.pdf_canvas import generate_pdf_resume_canvas
+from services.resume_ir import build_resume_ir
+
+# name -> (renderer, extension, content extractor)
+RENDERERS = {
+    "platypus": (generate_pdf_resume, "pdf", words),
+    "canvas": (generate_pdf_resume_canvas, "pdf", words),
+    "python-docx": (generate_docx_resume, "docx", describe),
+    "ooxml": (generate_docx_resume_ooxml, "docx", describe),
+}
+
+
+def digest(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--gap", type=float, default=2.1, help="seconds between the two stability renders")
+    args = parser.parse_args()
+
+    ir = build_resume_ir(sample_resume(roles=6, bullets=6))
+    ok = True
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        def path(name, profile, tag):
+            return os.path.join(tmp_dir, f"{name}_{profile}_{tag}.{RENDERERS[name][1]}")
+
+        first = {}
+        for name, (render, _, _) in RENDERERS.items():
+            for profile in OUTPUT_PROFILES:
+                render(ir, path(name, profile, "a"), profile)
+                first[(name, profile)] = digest(path(name, profile, "a"))
+        time.sleep(args.gap)
+
+        print(f"{'renderer':>12} {'profile':>9} {'bytes':>8} {'ms/render':>10}  byte-stable")
+        for name, (render, _, extract) in RENDERERS.items():
+            sizes = {}
+            for profile in OUTPUT_PROFILES:
+                out = path(name, profile, "b")
+                start = time.perf_counter()
+                for _ in range(args.iterations):
+                    render(ir, out, profile)
+                ms = (time.perf_counter() - start) * 1000 / args.iterations
+                stable = digest(out) == first[(name, profile)]
+                if profile == COMPACT:
+                    ok &= stable
+                sizes[profile] = os.path.getsize(out)
+                print(f"{name:>12} {profile:>9} {sizes[profile]:>8} {ms:>10.2f}  {'yes' if stable else 'no'}")
+
+            same = len({repr(extract(path(name, p, "b"))) for p in OUTPUT_PROFILES}) == 1
+            ok &= same
+            saved = 1 - sizes[COMPACT] / sizes[OUTPUT_PROFILES[0]]
+            print(f"{'':>12} content parity: {'OK' if same else 'MISMATCH'}, compact is {saved:.0%} smaller\n")
+
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Compares the platypus PDF renderer with the direct-canvas fast path.
+
+Checks layout parity first over a sweep of resume sizes: same page count and,
+page by page, the same text lines in the same order at the same positions
+(baseline and left / right edge, within --tolerance points), plus the same
+section rules. Then times both renderers on a one-page and a multi-page resume.
+
+Usage (from backend/):
+    python -m benchmarks.bench_pdf_renderers [--iterations 50] [--tolerance 0.5]
+"""
+import argparse
+import itertools
+import os
+import re
+import tempfile
+import time
+from collections import defaultdict
+
+import pdfminer.high_level
+from pdfminer.layout import LTChar, LTCurve
+
+from benchmarks.sample_resume import sample_resume
+from services.generator import generate_pdf_resume
+from services.pdf_canvas import generate_pdf_resume_canvas
+from services.resume_ir import build_resume_ir
+
+RENDERERS = {
+    "platypus": generate_pdf_resume,
+    "canvas": generate_pdf_resume_canvas,
+}
+
+# (roles, bullets, projects): one page, page breaks inside bullets, tables and sections
+SWEEP = list(itertools.product((0, 1, 3, 4, 7, 10), (1, 3, 5, 7), (0, 3, 6)))
+
+
+def words(path: str) -> list:
+    return re.findall(r"\S+", pdfminer.high_level.extract_text(path))
+
+
+def _objects(item):
+    yield item
+    if hasattr(item, "__iter__"):
+        for child in item:
+            yield from _objects(child)
+
+
+def page_layout(path: str) -> list:
+    """
+    Per page: text lines top to bottom as (baseline, x0, x1, text), and the
+    horizontal rules as (y, x0, x1). Glyphs sharing a baseline form one line.
+    """
+    pages = []
+    for page in pdfminer.high_level.extract_pages(path):
+        rows = defaultdict(list)
+        rules = []
+        for obj in _objects(page):
+            if isinstance(obj, LTChar):
+                rows[round(obj.y0, 1)].append(obj)
+            elif isinstance(obj, LTCurve):  # LTLine / LTRect
+                rules.append((obj.y0, obj.x0, obj.x1))
+        lines = []
+        for y in sorted(rows, reverse=True):
+            chars = sorted(rows[y], key=lambda c: c.x0)
+            text = chars[0].get_text()
+            for prev, char in zip(chars, chars[1:]):
+                text += (" " if char.x0 - prev.x1 > 1 else "") + char.get_text()
+            lines.append((y, chars[0].x0, chars[-1].x1, text))
+        pages.append((lines, sorted(rules, reverse=True)))
+    return pages
+
+
+def _close(a: tuple, b: tuple, tolerance: float) -> bool:
+    return all(abs(x - y) <= tolerance for x, y in zip(a, b))
+
+
+def layout_diff(expected: list, actual: list, tolerance: float) -> str:
+    """First difference between two page_layout results, or "" when they match."""
+    if len(expected) != len(actual):
+        return f"pages {len(expected)} vs {len(actual)}"
+    for number, ((e_lines, e_rules), (a_lines, a_rules)) in enumerate(zip(expected, actual), 1):
+        for e, a in itertools.zip_longest(e_lines, a_lines):
+            if e is None or a is None or e[3] != a[3] or not _close(e[:3], a[:3], tolerance):
+                return f"page {number}: line {e} vs {a}"
+        if len(e_rules) != len(a_rules) or not all(_close(e, a, tolerance) for e, a in zip(e_rules, a_rules)):
+            return f"page {number}: rules {e_rules} vs {a_rules}"
+    return ""
+
+
+def check_parity(tmp_dir: str, tolerance: float) -> bool:
+    failures = 0
+    pages = defaultdict(int)
+    for roles, bullets, projects in SWEEP:
+        data = sample_resume(roles=roles, bullets=bullets, projects=projects)
+        layouts = {}
+        for name, render in RENDERERS.items():
+            path = os.path.join(tmp_dir, f"parity_{name}.pdf")
+            render(data, path)
+            layouts[name] = page_layout(path)
+        pages[len(layouts["platypus"])] += 1
+        diff = layout_diff(layouts["platypus"], layouts["canvas"], tolerance)
+        if diff:
+            failures += 1
+            print(f"  roles={roles} bullets={bullets} projects={projects}: {diff}")
+    spread = ", ".join(f"{n} page(s): {count}" for n, count in sorted(pages.items()))
+    print(f"parity over {len(SWEEP)} resumes ({spread}): {len(SWEEP) - failures} match, {failures} differ "
+          f"-> {'OK' if not failures else 'FAIL'}")
+    return not failures
+
+
+def bench(data: dict, iterations: int, tmp_dir: str):
+    ir = build_resume_ir(data)
+    timings = {}
+    for name, render in RENDERERS.items():
+        path = os.path.join(tmp_dir, f"bench_{name}.pdf")
+        render(ir, path)  # warm up font metrics / caches
+        start = time.perf_counter()
+        for _ in range(iterations):
+            render(ir, path)
+        timings[name] = (time.perf_counter() - start) / iterations * 1000
+        print(f"{name:>9}: {timings[name]:.2f} ms/render")
+    print(f"  speedup: {timings['platypus'] / timings['canvas']:.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--tolerance", type=float, default=0.5, help="points")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        ok = check_parity(tmp_dir, args.tolerance)
+        print(f"\n{args.iterations} iterations, one-page resume:")
+        bench(sample_resume(), args.iterations, tmp_dir)
+        print(f"\n{args.iterations} iterations, multi-page resume:")
+        bench(sample_resume(roles=10, bullets=8, projects=6), args.iterations, tmp_dir)
+
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
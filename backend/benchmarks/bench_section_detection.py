@@ -0,0 +1,112 @@
+"""
+Regression check and timing for layout-aware section detection.
+
+Renders resumes with every PDF / DOCX renderer in this repo, using one-word
+all-caps employer and school names ("GOOGLE", "MIT") that look like headings,
+extracts them with read_document_layout and parses them with
+heuristic_parse_resume(text, spans). Checks that the known headings are found
+and that every word of every ResumeData field lands in the matching parsed
+field (for skills, every listed skill; the taxonomy regroups them under its
+own categories). Then reports extraction + parse time per renderer.
+
+Usage (from backend/):
+    python -m benchmarks.bench_section_detection [--iterations 20]
+"""
+import argparse
+import os
+import re
+import tempfile
+import time
+
+from benchmarks.sample_resume import sample_resume
+from services.docx_ooxml import generate_docx_resume_ooxml
+from services.enhancer import heuristic_parse_resume
+from services.generator import generate_docx_resume, generate_pdf_resume
+from services.parser import read_document_layout
+from services.pdf_canvas import generate_pdf_resume_canvas
+
+RENDERERS = {
+    "platypus": (generate_pdf_resume, "pdf"),
+    "canvas": (generate_pdf_resume_canvas, "pdf"),
+    "python-docx": (generate_docx_resume, "docx"),
+    "ooxml": (generate_docx_resume_ooxml, "docx"),
+}
+FIELDS = ("contact", "summary", "skills", "experience", "education", "projects", "course_work")
+COMPANIES = ["GOOGLE", "META", "AMAZON", "NETFLIX", "STRIPE", "NVIDIA", "ORACLE", "UBER", "AIRBNB", "APPLE"]
+# (roles, bullets, projects)
+SIZES = [(1, 2, 1), (4, 5, 3), (8, 4, 4)]
+
+
+def resume(roles: int, bullets: int, projects: int) -> dict:
+    data = sample_resume(roles=roles, bullets=bullets, projects=projects)
+    data["experience"] = [e.replace(f"COMPANY {r}", COMPANIES[r % len(COMPANIES)], 1)
+                          for r, e in enumerate(data["experience"])]
+    data["education"] = ["MIT, M.S. Computer Science, GPA 3.9, 2016", "STANFORD, B.S. EECS, 2014"]
+    return data
+
+
+def words(value) -> set:
+    text = value if isinstance(value, str) else "\n".join(value)
+    return set(re.findall(r"\w+", text.lower()))
+
+
+def missing_words(data: dict, parsed: dict) -> dict:
+    """Field -> words of the input field that are not in the same parsed field."""
+    missing = {}
+    for field in FIELDS:
+        value = data[field]
+        if field == "skills":
+            value = [line.split(":", 1)[-1] for line in value]
+        lost = words(value) - words(parsed.get(field) or "")
+        if lost:
+            missing[field] = sorted(lost)
+    return missing
+
+
+def check(tmp_dir: str) -> bool:
+    failures = 0
+    for size in SIZES:
+        data = resume(*size)
+        for name, (render, ext) in RENDERERS.items():
+            path = os.path.join(tmp_dir, f"{name}.{ext}")
+            render(data, path)
+            document = read_document_layout(path, path)
+            keys = [span.key for span in document.sections]
+            missing = missing_words(data, heuristic_parse_resume(document.text, document.sections))
+            expected = {"summary", "skills", "experience", "education", "projects", "course_work"}
+            if missing or set(keys) != expected or len(keys) != len(expected):
+                failures += 1
+                print(f"  {name} roles={size[0]}: sections {keys}, missing {missing}")
+    total = len(SIZES) * len(RENDERERS)
+    print(f"section detection over {total} documents: {total - failures} intact, {failures} lossy "
+          f"-> {'OK' if not failures else 'FAIL'}")
+    return not failures
+
+
+def bench(iterations: int, tmp_dir: str):
+    data = resume(4, 5, 3)
+    for name, (render, ext) in RENDERERS.items():
+        path = os.path.join(tmp_dir, f"bench_{name}.{ext}")
+        render(data, path)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            document = read_document_layout(path, path)
+            heuristic_parse_resume(document.text, document.sections)
+        print(f"{name:>12}: {(time.perf_counter() - start) / iterations * 1000:.2f} ms extract + parse")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        ok = check(tmp_dir)
+        print(f"\n{args.iterations} iterations:")
+        bench(args.iterations, tmp_dir)
+
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
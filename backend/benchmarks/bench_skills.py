@@ -0,0 +1,107 @@
+"""
+Benchmarks the skills taxonomy matcher.
+
+Pads the shipped taxonomy with synthetic entries (to model a taxonomy with
+thousands of skills and aliases), then reports compile time and scan throughput
+for single resumes and a batch, next to a naive one-regex-per-alias scan.
+Also checks that common-word skill names ("Spring", "Rust") only match with
+tech context.
+
+Usage (from backend/):
+    python -m benchmarks.bench_skills [--synthetic 5000] [--batch 1000]
+"""
+import argparse
+import json
+import re
+import time
+
+from benchmarks.sample_resume import sample_resume
+from services.skills import SKILLS_TAXONOMY_PATH, SkillTaxonomy, get_skill_taxonomy
+
+# text -> skills that must (True) / must not (False) be found
+CONTEXT_CASES = [
+    ("Software Engineering Intern, Spring 2020", {"Spring": False}),
+    ("Led Rust belt logistics expansion for the midwest region", {"Rust": False}),
+    ("Shipped via Express delivery. Make it count", {"Express": False, "Make": False}),
+    ("Languages: Python, Rust, Swift", {"Rust": True, "Swift": True}),
+    ("Built REST APIs with Spring and PostgreSQL.", {"Spring": True}),
+    ("Node services on Express and MongoDB; builds driven by Make", {"Express": True}),
+]
+
+
+def resume_text(data: dict) -> str:
+    return "\n".join([data["contact"], data["summary"], *data["skills"], *data["experience"],
+                      *data["education"], *data["projects"], *data["course_work"]])
+
+
+def padded_taxonomy(synthetic: int) -> dict:
+    with open(SKILLS_TAXONOMY_PATH, encoding="utf-8") as f:
+        taxonomy = json.load(f)
+    taxonomy["categories"]["Synthetic"] = [
+        {"name": f"Tool{i:05d}", "aliases": [f"tool-{i}", f"tool {i} framework"]} for i in range(synthetic)
+    ]
+    return taxonomy
+
+
+def naive_scan(taxonomy: dict, text: str) -> set:
+    found = set()
+    for entries in taxonomy["categories"].values():
+        for entry in entries:
+            for form in [entry["name"], *entry.get("aliases", [])]:
+                if re.search(r'(?<![\w+#])' + re.escape(form) + r'(?![\w+#])', text, re.IGNORECASE):
+                    found.add(entry["name"])
+                    break
+    return found
+
+
+def check_context() -> bool:
+    taxonomy = get_skill_taxonomy()
+    failures = 0
+    for text, expected in CONTEXT_CASES:
+        found = {name for names in taxonomy.categorize(text).values() for name in names}
+        wrong = [name for name, present in expected.items() if (name in found) != present]
+        if wrong:
+            failures += 1
+            print(f"  {text!r}: wrong for {', '.join(wrong)} (found {sorted(found)})")
+    print(f"context checks: {len(CONTEXT_CASES) - failures}/{len(CONTEXT_CASES)} -> {'OK' if not failures else 'FAIL'}")
+    return not failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--synthetic", type=int, default=5000, help="extra synthetic taxonomy entries")
+    parser.add_argument("--batch", type=int, default=1000, help="resumes in the batch run")
+    args = parser.parse_args()
+
+    taxonomy = padded_taxonomy(args.synthetic)
+    entries = sum(len(v) for v in taxonomy["categories"].values())
+
+    start = time.perf_counter()
+    matcher = SkillTaxonomy(taxonomy)
+    compile_ms = (time.perf_counter() - start) * 1000
+    print(f"taxonomy: {entries} entries, {len(matcher._patterns)} patterns, "
+          f"{len(matcher._goto)} automaton states, compiled in {compile_ms:.1f} ms")
+
+    texts = [resume_text(sample_resume(roles=2 + i % 6, bullets=3 + i % 5)) for i in range(args.batch)]
+    chars = sum(len(t) for t in texts)
+
+    start = time.perf_counter()
+    for text in texts:
+        matcher.categorize(text)
+    elapsed = time.perf_counter() - start
+    print(f"aho-corasick: {args.batch} resumes ({chars / 1e6:.1f}M chars) in {elapsed:.2f}s "
+          f"-> {elapsed / args.batch * 1000:.2f} ms/resume, {chars / elapsed / 1e6:.2f}M chars/s")
+
+    naive_n = min(3, args.batch)
+    start = time.perf_counter()
+    for text in texts[:naive_n]:
+        naive_scan(taxonomy, text)
+    naive_elapsed = (time.perf_counter() - start) / naive_n
+    print(f"naive regex:  {naive_elapsed * 1000:.2f} ms/resume "
+          f"({naive_elapsed / (elapsed / args.batch):.0f}x slower)")
+
+    raise SystemExit(0 if check_context() else 1)
+
+
+if __name__ == "__main__":
+    main()
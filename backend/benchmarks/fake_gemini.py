@@ -0,0 +1,115 @@
+"""
+Local stand-in for the Gemini REST API, for offline load tests.
+
+Answers POST /v1beta/models/<model>:generateContent with a canned enhanced resume
+after a configurable delay, and injects 500s and 429s at configurable rates.
+Point the backend at it with:
+    GEMINI_API_KEY=fake GEMINI_API_ENDPOINT=http://127.0.0.1:<port>
+
+Usage (from backend/):
+    python -m benchmarks.fake_gemini --port 8765 --latency 1.5 --jitter 0.5 --error-rate 0.02 --rate-limit-rate 0.05
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from benchmarks.sample_resume import sample_resume
+
+# Marker in the canned response so callers can tell a real enhancement from the heuristic fallback
+FAKE_CONTACT = "Fake Gemini | (555) 000-0000 | fake@example.com"
+
+
+def canned_response() -> bytes:
+    data = dict(sample_resume(), contact=FAKE_CONTACT)
+    body = {
+        "candidates": [{
+            "content": {"parts": [{"text": "```json\n" + json.dumps(data) + "\n```"}], "role": "model"},
+            "finishReason": "STOP",
+            "index": 0,
+        }],
+        "usageMetadata": {"promptTokenCount": 1200, "candidatesTokenCount": 900, "totalTokenCount": 2100},
+    }
+    return json.dumps(body).encode()
+
+
+class FakeGeminiServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port: int = 0, latency: float = 1.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, rate_limit_rate: float = 0.0, seed: int = 0):
+        super().__init__(("127.0.0.1", port), _Handler)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.random = random.Random(seed)
+        self.payload = canned_response()
+        self.counts = {"ok": 0, "error": 0, "rate_limited": 0}
+        self.lock = threading.Lock()
+
+    @property
+    def endpoint(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def start(self) -> "FakeGeminiServer":
+        threading.Thread(target=self.serve_forever, name="fake-gemini", daemon=True).start()
+        return self
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: FakeGeminiServer
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        srv = self.server
+        with srv.lock:
+            roll = srv.random.random()
+            delay = max(0.0, srv.latency + srv.random.uniform(-srv.jitter, srv.jitter))
+        time.sleep(delay)
+
+        if roll < srv.rate_limit_rate:
+            outcome, status = "rate_limited", 429
+            body = b'{"error": {"code": 429, "message": "Resource has been exhausted", "status": "RESOURCE_EXHAUSTED"}}'
+        elif roll < srv.rate_limit_rate + srv.error_rate:
+            outcome, status = "error", 500
+            body = b'{"error": {"code": 500, "message": "Internal error", "status": "INTERNAL"}}'
+        elif ":generateContent" in self.path:
+            outcome, status, body = "ok", 200, srv.payload
+        else:
+            outcome, status = "error", 404
+            body = b'{"error": {"code": 404, "message": "Not found", "status": "NOT_FOUND"}}'
+
+        with srv.lock:
+            srv.counts[outcome] += 1
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=1.0, help="mean response delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="uniform +/- jitter in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="fraction of requests answered with 429")
+    args = parser.parse_args()
+
+    server = FakeGeminiServer(args.port, args.latency, args.jitter, args.error_rate, args.rate_limit_rate)
+    print(f"Fake Gemini listening on {server.endpoint}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
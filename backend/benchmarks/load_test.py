@@ -0,0 +1,319 @@
+"""
+End-to-end load test for /api/resume/process and /api/resume/generate.
+
+Runs fully offline: a local fake Gemini (benchmarks/fake_gemini.py) is started
+in-process and the backend is pointed at it through GEMINI_API_KEY /
+GEMINI_API_ENDPOINT. The app is driven either in-process through httpx's ASGI
+transport or as a real `uvicorn --workers N` server.
+
+Requests are fired open-loop at a fixed target rate with a weighted mix of
+uploads and generate calls. Reports throughput, latency percentiles, HTTP
+errors, the enhancement fallback rate and reasons (the `fallback` field of
+heuristic or provisional /process results) and
+peak RSS per API process and per extraction worker. The --max-* options turn it into a deploy gate: the exit
+status is 1 if any threshold is exceeded.
+
+Usage (from backend/):
+    python -m benchmarks.load_test --rate 20 --duration 30 \\
+        --mix process=0.2,generate_pdf=0.5,generate_docx=0.3 \\
+        --gemini-latency 1.5 --gemini-jitter 1.0 --gemini-429-rate 0.05 \\
+        --mode uvicorn --workers 2 --max-p99-ms 3000 --max-fallback-rate 0.2
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List
+
+import httpx
+
+from benchmarks.fake_gemini import FakeGeminiServer
+from benchmarks.sample_resume import sample_resume
+
+KINDS = ("process", "generate_pdf", "generate_docx")
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    mix = {}
+    for part in spec.split(","):
+        kind, _, weight = part.partition("=")
+        kind = kind.strip()
+        if kind not in KINDS:
+            raise argparse.ArgumentTypeError(f"unknown request kind {kind!r}, expected one of {KINDS}")
+        mix[kind] = float(weight or 1)
+    return mix
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100 * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def sample_pdf_bytes() -> bytes:
+    from services.generator import generate_pdf_resume
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "upload.pdf")
+        generate_pdf_resume(sample_resume(), path)
+        with open(path, "rb") as f:
+            return f.read()
+
+
+# --- Peak RSS ---
+
+def _children(pid: int) -> List[int]:
+    kids = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # Field 4 is the ppid; comm (field 2) may contain spaces, so split after ')'
+                if int(f.read().rsplit(")", 1)[1].split()[1]) == pid:
+                    kids.append(int(entry))
+        except (OSError, IndexError, ValueError):
+            continue
+    return kids
+
+
+def _peak_rss_kib(pid: int) -> int:
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def _descendants(pid: int) -> List[int]:
+    found = []
+    pending = _children(pid)
+    while pending:
+        child = pending.pop()
+        found.append(child)
+        pending.extend(_children(child))
+    return sorted(found)
+
+
+def peak_rss_per_worker(server: subprocess.Popen = None) -> Dict[str, int]:
+    """
+    Peak RSS (KiB) of each API process and of every live process below it: the
+    extraction pool's forkserver and workers. Workers already recycled
+    (EXTRACTION_MAX_TASKS) have exited and are not counted.
+    """
+    if server is None:
+        rss = {"api (in-process)": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}
+        rss.update({f"child pid {pid}": _peak_rss_kib(pid) for pid in _descendants(os.getpid())})
+        return rss
+    rss = {}
+    for pid in _children(server.pid) or [server.pid]:
+        rss[f"api pid {pid}"] = _peak_rss_kib(pid)
+        rss.update({f"child pid {child}": _peak_rss_kib(child) for child in _descendants(pid)})
+    return rss
+
+
+# --- Load generation ---
+
+async def fire(client: httpx.AsyncClient, kind: str, upload: bytes, payload: dict, args, results: list):
+    start = time.perf_counter()
+    fallback = None
+    try:
+        if kind == "process":
+            params = {"deadline": args.deadline} if args.deadline is not None else {}
+            resp = await client.post("/api/resume/process", params=params,
+                                     files={"file": ("resume.pdf", upload, "application/pdf")})
+            if resp.status_code == 200:
+                body = resp.json()
+                # Fallback reason, or "" for a Gemini result
+                fallback = "" if body.get("enhanced") else body.get("fallback") or "unknown"
+        else:
+            if kind == "generate_pdf":
+                params = {"format": "pdf", "renderer": args.renderer}
+            else:
+                params = {"format": "docx", "renderer": args.docx_renderer}
+            resp = await client.post("/api/resume/generate", json=payload, params=params)
+            await resp.aread()
+        status = resp.status_code
+    except httpx.HTTPError as e:
+        status = type(e).__name__
+    results.append((kind, status, time.perf_counter() - start, fallback))
+
+
+async def run_load(client: httpx.AsyncClient, args) -> tuple:
+    rng = random.Random(args.seed)
+    kinds, weights = zip(*args.mix.items())
+    upload = sample_pdf_bytes()
+    payload = sample_resume()
+    results: list = []
+
+    total = int(args.rate * args.duration)
+    tasks = []
+    start = time.perf_counter()
+    for i in range(total):
+        # Open loop: arrivals are scheduled on the clock, not on completions
+        delay = start + i / args.rate - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        kind = rng.choices(kinds, weights)[0]
+        tasks.append(asyncio.create_task(fire(client, kind, upload, payload, args, results)))
+    await asyncio.gather(*tasks)
+    return results, time.perf_counter() - start
+
+
+async def run_inprocess(args) -> tuple:
+    import main
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=args.timeout) as client:
+        results, elapsed = await run_load(client, args)
+    return results, elapsed, peak_rss_per_worker()
+
+
+async def run_uvicorn(args) -> tuple:
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(args.port),
+         "--workers", str(args.workers), "--log-level", "warning"],
+        env=os.environ.copy(),
+    )
+    base_url = f"http://127.0.0.1:{args.port}"
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    try:
+        async with httpx.AsyncClient(base_url=base_url, timeout=args.timeout, limits=limits) as client:
+            for _ in range(100):
+                try:
+                    if (await client.get("/openapi.json")).status_code == 200:
+                        break
+                except httpx.TransportError:
+                    pass
+                await asyncio.sleep(0.1)
+            else:
+                raise RuntimeError("uvicorn did not come up")
+            results, elapsed = await run_load(client, args)
+        return results, elapsed, peak_rss_per_worker(server)
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+# --- Reporting ---
+
+def summarize(results: list, elapsed: float, rss: Dict[str, int], gemini: FakeGeminiServer, args) -> dict:
+    by_kind = defaultdict(list)
+    for row in results:
+        by_kind[row[0]].append(row)
+        by_kind["all"].append(row)
+
+    report = {"elapsed_s": round(elapsed, 2), "target_rps": args.rate, "kinds": {}}
+    for kind, rows in sorted(by_kind.items()):
+        latencies = sorted(r[2] * 1000 for r in rows)
+        ok = [r for r in rows if r[1] == 200]
+        fallbacks = [r for r in rows if r[3] is not None]
+        report["kinds"][kind] = {
+            "requests": len(rows),
+            "throughput_rps": round(len(ok) / elapsed, 2) if elapsed else 0.0,
+            "error_rate": round(1 - len(ok) / len(rows), 4),
+            "p50_ms": round(percentile(latencies, 50), 1),
+            "p95_ms": round(percentile(latencies, 95), 1),
+            "p99_ms": round(percentile(latencies, 99), 1),
+            "max_ms": round(latencies[-1], 1),
+            "fallback_rate": round(sum(bool(r[3]) for r in fallbacks) / len(fallbacks), 4) if fallbacks else None,
+            "fallback_reasons": dict(Counter(r[3] for r in fallbacks if r[3])),
+        }
+    report["gemini_calls"] = dict(gemini.counts)
+    report["peak_rss_mib"] = {k: round(v / 1024, 1) for k, v in rss.items()}
+    return report
+
+
+def print_report(report: dict):
+    print(f"\nElapsed {report['elapsed_s']}s at target {report['target_rps']} req/s")
+    header = f"{'kind':>14} {'reqs':>6} {'rps':>7} {'err%':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8} {'fallback%':>10}"
+    print(header)
+    print("-" * len(header))
+    for kind, k in report["kinds"].items():
+        fb = f"{k['fallback_rate'] * 100:.1f}" if k["fallback_rate"] is not None else "-"
+        print(f"{kind:>14} {k['requests']:>6} {k['throughput_rps']:>7} {k['error_rate'] * 100:>6.1f} "
+              f"{k['p50_ms']:>8} {k['p95_ms']:>8} {k['p99_ms']:>8} {k['max_ms']:>8} {fb:>10}")
+    for kind, k in report["kinds"].items():
+        if k["fallback_reasons"] and kind != "all":
+            print(f"{kind} fallbacks: {k['fallback_reasons']}")
+    print(f"\nFake Gemini calls: {report['gemini_calls']}")
+    for worker, mib in report["peak_rss_mib"].items():
+        print(f"Peak RSS {worker}: {mib} MiB")
+
+
+def check_gates(report: dict, args) -> List[str]:
+    overall = report["kinds"].get("all", {})
+    failures = []
+    if args.max_p99_ms is not None and overall.get("p99_ms", 0) > args.max_p99_ms:
+        failures.append(f"p99 {overall['p99_ms']}ms > {args.max_p99_ms}ms")
+    if args.max_error_rate is not None and overall.get("error_rate", 0) > args.max_error_rate:
+        failures.append(f"error rate {overall['error_rate']} > {args.max_error_rate}")
+    process = report["kinds"].get("process", {})
+    if args.max_fallback_rate is not None and (process.get("fallback_rate") or 0) > args.max_fallback_rate:
+        failures.append(f"fallback rate {process['fallback_rate']} > {args.max_fallback_rate}")
+    if args.max_rss_mib is not None:
+        for worker, mib in report["peak_rss_mib"].items():
+            if mib > args.max_rss_mib:
+                failures.append(f"peak RSS {worker} {mib}MiB > {args.max_rss_mib}MiB")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=["inprocess", "uvicorn"], default="inprocess")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes (uvicorn mode)")
+    parser.add_argument("--port", type=int, default=8001, help="uvicorn port (uvicorn mode)")
+    parser.add_argument("--rate", type=float, default=10.0, help="target requests per second")
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds of load")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("process=0.2,generate_pdf=0.5,generate_docx=0.3"))
+    parser.add_argument("--renderer", default="platypus", help="PDF renderer for generate_pdf requests")
+    parser.add_argument("--docx-renderer", default="python-docx", help="DOCX renderer for generate_docx requests")
+    parser.add_argument("--deadline", type=float, default=None, help="per-request /process deadline in seconds (default: none, /process waits for Gemini)")
+    parser.add_argument("--timeout", type=float, default=120.0, help="client timeout per request")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--gemini-latency", type=float, default=1.0)
+    parser.add_argument("--gemini-jitter", type=float, default=0.5)
+    parser.add_argument("--gemini-error-rate", type=float, default=0.0)
+    parser.add_argument("--gemini-429-rate", type=float, default=0.0)
+    parser.add_argument("--json", help="also write the report to this file")
+    parser.add_argument("--max-p99-ms", type=float)
+    parser.add_argument("--max-error-rate", type=float)
+    parser.add_argument("--max-fallback-rate", type=float)
+    parser.add_argument("--max-rss-mib", type=float)
+    args = parser.parse_args()
+
+    gemini = FakeGeminiServer(latency=args.gemini_latency, jitter=args.gemini_jitter,
+                              error_rate=args.gemini_error_rate, rate_limit_rate=args.gemini_429_rate,
+                              seed=args.seed).start()
+    # Set before the app is imported / spawned so the enhancer only ever talks to the fake
+    os.environ["GEMINI_API_KEY"] = "fake-load-test-key"
+    os.environ["GEMINI_API_ENDPOINT"] = gemini.endpoint
+
+    runner = run_inprocess if args.mode == "inprocess" else run_uvicorn
+    results, elapsed, rss = asyncio.run(runner(args))
+    gemini.shutdown()
+
+    report = summarize(results, elapsed, rss, gemini, args)
+    print_report(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+    failures = check_gates(report, args)
+    for failure in failures:
+        print(f"GATE FAILED: {failure}")
+    raise SystemExit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
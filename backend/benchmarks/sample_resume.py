@@ -0,0 +1,40 @@
+"""Synthetic ResumeData payloads shared by the benchmark scripts."""
+
+def sample_resume(roles: int = 4, bullets: int = 5, projects: int = 3) -> dict:
+    """Builds a realistic ResumeData dict; raise roles/bullets to force multi-page output."""
+    experience = []
+    for r in range(roles):
+        lines = [f"COMPANY {r} | Senior Software Engineer | 0{1 + r % 9}/20{15 + r % 10} - Present"]
+        for b in range(bullets):
+            lines.append(
+                f"• Architected a distributed event pipeline processing {b + 1}0M events/day with Kafka and "
+                f"Flink, cutting p99 latency by {20 + b}% and saving ${b + 2}00K/year in compute costs"
+            )
+        experience.append("\n".join(lines))
+
+    projects_list = []
+    for p in range(projects):
+        projects_list.append(
+            f"Project {p} | Python, FastAPI, React, PostgreSQL\n"
+            f"• Built an end-to-end resume tooling service used by {p + 1},000 students\n"
+            f"• Designed a caching layer that reduced median response time from 400ms to 60ms"
+        )
+
+    return {
+        "contact": "Jane Doe | (555) 123-4567 | jane.doe@example.com | linkedin.com/in/janedoe | github.com/janedoe",
+        "summary": "Backend engineer with 8 years of experience building large-scale distributed systems, "
+                   "data pipelines and developer platforms at high-growth companies.",
+        "skills": [
+            "Languages: Python, Java, Go, TypeScript, SQL",
+            "Frameworks: FastAPI, Django, Spring Boot, React",
+            "Tools: Docker, Kubernetes, AWS, Terraform, Kafka",
+        ],
+        "experience": experience,
+        "education": [
+            "Stanford University, M.S. Computer Science, GPA 3.9, 2016",
+            "UC Berkeley, B.S. EECS, 2014",
+        ],
+        "projects": projects_list,
+        "course_work": ["Distributed Systems, Operating Systems, Machine Learning, Databases"],
+        "section_order": ["education", "skills", "experience", "projects", "course_work"],
+    }
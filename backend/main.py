@@ -21,9 +21,19 @@ app.add_middleware(
 )
 
 from routers import resume
+from services.extraction_pool import get_extraction_pool, shutdown_extraction_pool
 
 app.include_router(resume.router, prefix="/api/resume", tags=["resume"])
 
+@app.on_event("startup")
+def start_extraction_pool():
+    # Pre-start extraction workers so the first upload doesn't pay for process startup
+    get_extraction_pool()
+
+@app.on_event("shutdown")
+def stop_extraction_pool():
+    shutdown_extraction_pool()
+
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 
@@ -3,12 +3,18 @@ import os
 import uuid
 from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks
 from fastapi.responses import FileResponse, JSONResponse
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import List, Optional
 
-from services.parser import extract_text
-from services.enhancer import heuristic_parse_resume, enhance_content
-from services.generator import generate_pdf_resume, generate_docx_resume
+from services.extraction_pool import extract_document_isolated, ExtractionError, ExtractionBusyError
+from services.enhancer import enhance_content_with_deadline, get_upgrade
+from services.enhancer import enhance_section, SECTION_FORMATS
+from services.matcher import match_resumes
+from services.generator import generate_pdf_resume, generate_docx_resume, generate_resume_bundle
+from services.pdf_canvas import generate_pdf_resume_canvas
+from services.docx_ooxml import generate_docx_resume_ooxml
+from services.output_profile import resolve_profile, write_zip, get_render_metrics
 
 router = APIRouter()
 
@@ -18,6 +24,25 @@ OUTPUT_DIR = "temp_outputs"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
+# Selectable per request via /generate?renderer=...
+PDF_RENDERERS = {
+    "platypus": generate_pdf_resume,
+    "canvas": generate_pdf_resume_canvas,
+}
+DOCX_RENDERERS = {
+    "python-docx": generate_docx_resume,
+    "ooxml": generate_docx_resume_ooxml,
+}
+DEFAULT_PDF_RENDERER = "platypus"
+DEFAULT_DOCX_RENDERER = "python-docx"
+
+def select_renderer(renderers: dict, renderer: Optional[str], default: str):
+    """Looks up ?renderer= for the requested format; unknown names are a 400."""
+    name = (renderer or default).lower()
+    if name not in renderers:
+        raise HTTPException(status_code=400, detail=f"Unknown renderer '{name}' for this format. Use one of: {', '.join(renderers)}")
+    return renderers[name]
+
 class ResumeData(BaseModel):
     contact: Optional[str] = ""
     summary: Optional[str] = ""
@@ -31,6 +56,18 @@ class ResumeData(BaseModel):
     class Config:
         arbitrary_types_allowed = True
 
+class SectionEnhanceRequest(BaseModel):
+    section: str
+    # Entries of that section to rewrite; a single entry is fine (contact / summary are one string)
+    items: List[str]
+
+
+class MatchRequest(BaseModel):
+    resumes: List[ResumeData]
+    job_descriptions: List[str]
+    # Best resumes returned per job description; all of them when omitted
+    top_k: Optional[int] = None
+
 
 def cleanup_files(files: List[str]):
     """Deletes files after response is sent."""
@@ -44,10 +81,13 @@ def cleanup_files(files: List[str]):
                 print(f"Error deleting {file_path}: {e}")
 
 @router.post("/process")
-async def process_resume(file: UploadFile = File(...)):
+async def process_resume(file: UploadFile = File(...), deadline: Optional[float] = None):
     if not file.filename:
         raise HTTPException(status_code=400, detail="No file uploaded")
     
+    if deadline is not None and deadline <= 0:
+        raise HTTPException(status_code=400, detail="deadline must be greater than 0 seconds")
+    
     file_ext = os.path.splitext(file.filename)[1]
     if file_ext.lower() not in ['.pdf', '.docx']:
         raise HTTPException(status_code=400, detail="Invalid file type. Only PDF and DOCX supported.")
@@ -59,38 +99,110 @@ async def process_resume(file: UploadFile = File(...)):
     with open(file_path, "wb") as buffer:
         shutil.copyfileobj(file.file, buffer)
         
-    # 1. Parse
-    raw_text = extract_text(file_path, filename)
-    
-    # 2. Enhance
-    enhanced_data = enhance_content(raw_text)
+    # 1. Parse (in an isolated, time- and memory-limited worker process)
+    try:
+        document = await run_in_threadpool(extract_document_isolated, file_path, filename)
+    except ExtractionBusyError as e:
+        raise HTTPException(status_code=503, detail=f"Server busy, try again shortly: {str(e)}", headers={"Retry-After": "5"})
+    except ExtractionError as e:
+        raise HTTPException(status_code=422, detail=f"Could not read file: {str(e)}")
+    finally:
+        # Clean up input file immediately
+        cleanup_files([file_path])
     
-    # Clean up input file immediately
-    cleanup_files([file_path])
+    # 2. Enhance (bounded by the latency budget; may return a provisional heuristic result)
+    enhanced_data = await enhance_content_with_deadline(document.text, deadline, document.sections)
     
     return JSONResponse(content=enhanced_data)
 
+@router.get("/process/{token}")
+async def get_processed_upgrade(token: str):
+    """Fetches the Gemini result for a /process response that was returned as provisional."""
+    entry = get_upgrade(token)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired upgrade token")
+    
+    if entry["status"] == "pending":
+        return JSONResponse(status_code=202, content={"status": "pending"})
+    if entry["status"] == "failed":
+        return JSONResponse(content={"status": "failed"})
+    return JSONResponse(content={"status": "ready",
+                                 "data": {**entry["data"], "provisional": False, "enhanced": True, "fallback": None}})
+
+@router.post("/enhance-section")
+async def enhance_resume_section(request: SectionEnhanceRequest):
+    """Re-enhances only the given entries of one section. Unchanged entries are served from cache."""
+    if request.section not in SECTION_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Invalid section. Use one of: {', '.join(SECTION_FORMATS)}")
+    if not request.items:
+        raise HTTPException(status_code=400, detail="No items to enhance")
+    
+    result = await run_in_threadpool(enhance_section, request.section, request.items)
+    return JSONResponse(content=result)
+
+@router.post("/match")
+async def match_job_descriptions(request: MatchRequest):
+    """Ranks the resumes against every job description, with matched / missing keywords."""
+    if not request.resumes or not request.job_descriptions:
+        raise HTTPException(status_code=400, detail="Provide at least one resume and one job description")
+    if request.top_k is not None and request.top_k < 1:
+        raise HTTPException(status_code=400, detail="top_k must be at least 1")
+    
+    resumes = [r.dict() for r in request.resumes]
+    results = await run_in_threadpool(match_resumes, resumes, request.job_descriptions, request.top_k)
+    return JSONResponse(content={"results": results})
+
 @router.post("/generate")
-async def generate_resume_file(data: ResumeData, background_tasks: BackgroundTasks, format: str = "pdf"):
+async def generate_resume_file(data: ResumeData, background_tasks: BackgroundTasks, format: str = "pdf", renderer: Optional[str] = None,
+                               profile: Optional[str] = None):
+    try:
+        profile = resolve_profile(profile)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if format.lower() == 'zip' and renderer is not None:
+        raise HTTPException(status_code=400, detail="renderer is not supported with format=zip; the bundle uses the default renderers")
     file_id = str(uuid.uuid4())
     
     # Convert Pydantic model to dict
     resume_dict = data.dict()
     
-    if format.lower() == 'docx':
+    if format.lower() == 'zip':
+        # PDF + DOCX from a single parse
+        pdf_path = os.path.join(OUTPUT_DIR, f"faang_resume_{file_id}.pdf")
+        docx_path = os.path.join(OUTPUT_DIR, f"faang_resume_{file_id}.docx")
+        output_filename = f"faang_resume_{file_id}.zip"
+        output_path = os.path.join(OUTPUT_DIR, output_filename)
+        media_type = "application/zip"
+        def build_bundle():
+            generate_resume_bundle(resume_dict, pdf_path, docx_path, profile)
+            members = []
+            for path, name in [(pdf_path, "FAANG_Resume.pdf"), (docx_path, "FAANG_Resume.docx")]:
+                with open(path, "rb") as f:
+                    members.append((name, f.read()))
+            write_zip(output_path, members, profile)
+        
+        try:
+            await run_in_threadpool(build_bundle)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Bundle Generation failed: {str(e)}")
+        finally:
+            cleanup_files([pdf_path, docx_path])
+    elif format.lower() == 'docx':
         output_filename = f"faang_resume_{file_id}.docx"
         output_path = os.path.join(OUTPUT_DIR, output_filename)
         media_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+        render = select_renderer(DOCX_RENDERERS, renderer, DEFAULT_DOCX_RENDERER)
         try:
-            generate_docx_resume(resume_dict, output_path)
+            await run_in_threadpool(render, resume_dict, output_path, profile)
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"DOCX Generation failed: {str(e)}")
     else:
         output_filename = f"faang_resume_{file_id}.pdf"
         output_path = os.path.join(OUTPUT_DIR, output_filename)
         media_type = "application/pdf"
+        render = select_renderer(PDF_RENDERERS, renderer, DEFAULT_PDF_RENDERER)
         try:
-            generate_pdf_resume(resume_dict, output_path)
+            await run_in_threadpool(render, resume_dict, output_path, profile)
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"PDF Generation failed: {str(e)}")
         
@@ -103,5 +215,11 @@ async def generate_resume_file(data: ResumeData, background_tasks: BackgroundTas
     return FileResponse(
         output_path, 
         media_type=media_type, 
-        filename=output_filename
+        filename=output_filename,
+        headers={"X-Output-Profile": profile, "X-Output-Bytes": str(os.path.getsize(output_path))}
     )
+
+@router.get("/render-metrics")
+async def render_metrics():
+    """Output size and render time per renderer and output profile, since startup."""
+    return JSONResponse(content={"metrics": get_render_metrics()})
@@ -0,0 +1,240 @@
+import re
+from typing import List, Optional, Union
+from xml.sax.saxutils import escape
+
+from services.resume_ir import ResumeIR, Entry, build_resume_ir
+from services.output_profile import reports_render_metrics, write_zip
+
+# Low-level DOCX backend. Produces the same layout as generator.generate_docx_resume
+# but streams document.xml from precompiled string templates into a zip together
+# with fixed styles/numbering parts, instead of going through python-docx's
+# per-paragraph / per-run proxy objects. Fonts come from the Normal style, so runs
+# only carry bold/italic/size overrides.
+
+# --- Fixed package parts ---
+
+CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/word/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+    '<Override PartName="/word/numbering.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.numbering+xml"/>'
+    '</Types>'
+)
+
+PACKAGE_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>'
+    '</Relationships>'
+)
+
+DOCUMENT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+    '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/numbering" Target="numbering.xml"/>'
+    '</Relationships>'
+)
+
+# Only the styles the template uses; defaults match python-docx's bundled template.
+STYLES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<w:styles xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    '<w:docDefaults>'
+    '<w:rPrDefault><w:rPr><w:sz w:val="22"/><w:szCs w:val="22"/><w:lang w:val="en-US"/></w:rPr></w:rPrDefault>'
+    '<w:pPrDefault><w:pPr><w:spacing w:after="200" w:line="276" w:lineRule="auto"/></w:pPr></w:pPrDefault>'
+    '</w:docDefaults>'
+    '<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/><w:qFormat/>'
+    '<w:rPr><w:rFonts w:ascii="Times New Roman" w:hAnsi="Times New Roman" w:cs="Times New Roman"/><w:sz w:val="21"/></w:rPr></w:style>'
+    '<w:style w:type="character" w:default="1" w:styleId="DefaultParagraphFont"><w:name w:val="Default Paragraph Font"/><w:uiPriority w:val="1"/><w:semiHidden/><w:unhideWhenUsed/></w:style>'
+    '<w:style w:type="paragraph" w:styleId="ListBullet"><w:name w:val="List Bullet"/><w:basedOn w:val="Normal"/><w:uiPriority w:val="99"/><w:unhideWhenUsed/>'
+    '<w:pPr><w:numPr><w:numId w:val="1"/></w:numPr><w:contextualSpacing/></w:pPr></w:style>'
+    '<w:style w:type="table" w:default="1" w:styleId="TableNormal"><w:name w:val="Normal Table"/><w:uiPriority w:val="99"/><w:semiHidden/><w:unhideWhenUsed/>'
+    '<w:tblPr><w:tblInd w:w="0" w:type="dxa"/><w:tblCellMar><w:top w:w="0" w:type="dxa"/><w:left w:w="108" w:type="dxa"/>'
+    '<w:bottom w:w="0" w:type="dxa"/><w:right w:w="108" w:type="dxa"/></w:tblCellMar></w:tblPr></w:style>'
+    '</w:styles>'
+)
+
+NUMBERING_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<w:numbering xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    '<w:abstractNum w:abstractNumId="0"><w:multiLevelType w:val="singleLevel"/>'
+    '<w:lvl w:ilvl="0"><w:start w:val="1"/><w:numFmt w:val="bullet"/><w:pStyle w:val="ListBullet"/>'
+    '<w:lvlText w:val="\uf0b7"/><w:lvlJc w:val="left"/>'
+    '<w:pPr><w:tabs><w:tab w:val="num" w:pos="360"/></w:tabs><w:ind w:left="360" w:hanging="360"/></w:pPr>'
+    '<w:rPr><w:rFonts w:ascii="Symbol" w:hAnsi="Symbol" w:hint="default"/></w:rPr></w:lvl></w:abstractNum>'
+    '<w:num w:numId="1"><w:abstractNumId w:val="0"/></w:num>'
+    '</w:numbering>'
+)
+
+# --- document.xml templates (sizes in half-points, spacing/indents in twips) ---
+
+DOCUMENT_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"><w:body>'
+)
+
+# Letter page, 0.5 inch margins
+DOCUMENT_END = (
+    '<w:sectPr><w:pgSz w:w="12240" w:h="15840"/>'
+    '<w:pgMar w:top="720" w:right="720" w:bottom="720" w:left="720" w:header="720" w:footer="720" w:gutter="0"/>'
+    '<w:cols w:space="720"/></w:sectPr></w:body></w:document>'
+)
+
+RUN = '<w:r>{rpr}<w:t xml:space="preserve">{text}</w:t></w:r>'
+PARAGRAPH = '<w:p>{ppr}{runs}</w:p>'
+
+NAME_PPR = '<w:pPr><w:jc w:val="center"/></w:pPr>'
+NAME_RPR = '<w:rPr><w:b/><w:color w:val="000000"/><w:sz w:val="48"/></w:rPr>'
+CONTACT_PPR = '<w:pPr><w:spacing w:after="200"/><w:jc w:val="center"/></w:pPr>'
+CONTACT_RPR = '<w:rPr><w:sz w:val="20"/></w:rPr>'
+SECTION_HEADER_PPR = (
+    '<w:pPr><w:pBdr><w:bottom w:val="single" w:sz="6" w:space="1" w:color="auto"/></w:pBdr>'
+    '<w:spacing w:before="240" w:after="80"/></w:pPr>'
+)
+SECTION_HEADER_RPR = '<w:rPr><w:b/><w:sz w:val="22"/></w:rPr>'
+SUMMARY_PPR = '<w:pPr><w:spacing w:after="240"/></w:pPr>'
+TITLE_PPR = '<w:pPr><w:spacing w:before="80" w:after="20"/></w:pPr>'
+BULLET_PPR = '<w:pPr><w:pStyle w:val="ListBullet"/><w:spacing w:after="20"/><w:ind w:left="288"/></w:pPr>'
+SKILL_PPR = '<w:pPr><w:spacing w:after="20"/></w:pPr>'
+COURSE_PPR = '<w:pPr><w:spacing w:after="20"/><w:ind w:left="216"/></w:pPr>'
+RIGHT_PPR = '<w:pPr><w:jc w:val="right"/></w:pPr>'
+BOLD_RPR = '<w:rPr><w:b/></w:rPr>'
+ITALIC_RPR = '<w:rPr><w:i/></w:rPr>'
+
+# Two equal columns over the 7.5 inch text width, zero indent and zero left cell margin
+TABLE_START = (
+    '<w:tbl><w:tblPr><w:tblW w:w="0" w:type="auto"/><w:tblInd w:w="0" w:type="dxa"/><w:tblLayout w:type="fixed"/>'
+    '<w:tblLook w:val="04A0" w:firstRow="1" w:lastRow="0" w:firstColumn="1" w:lastColumn="0" w:noHBand="0" w:noVBand="1"/>'
+    '</w:tblPr><w:tblGrid><w:gridCol w:w="5400"/><w:gridCol w:w="5400"/></w:tblGrid>'
+)
+TABLE_END = '</w:tbl>'
+CELL = '<w:tc><w:tcPr><w:tcW w:w="5400" w:type="dxa"/><w:tcMar><w:left w:w="0" w:type="dxa"/></w:tcMar></w:tcPr>{paragraph}</w:tc>'
+ROW = '<w:tr>{cells}</w:tr>'
+
+# Characters that are not allowed in XML 1.0 (python-docx would raise on these)
+_INVALID_XML_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def _run(text: str, rpr: str = "") -> str:
+    return RUN.format(rpr=rpr, text=escape(_INVALID_XML_CHARS.sub('', text)))
+
+
+def _paragraph(runs: str = "", ppr: str = "") -> str:
+    return PARAGRAPH.format(ppr=ppr, runs=runs)
+
+
+def _entry_header(entry: Entry) -> str:
+    if not entry.has_columns:
+        return _paragraph(_run(entry.title, BOLD_RPR), TITLE_PPR)
+    parts = [TABLE_START]
+    parts.append(ROW.format(cells=(
+        CELL.format(paragraph=_paragraph(_run(entry.title, BOLD_RPR))) +
+        CELL.format(paragraph=_paragraph(_run(entry.date), RIGHT_PPR) if entry.date else _paragraph())
+    )))
+    if entry.subtitle:
+        parts.append(ROW.format(cells=(
+            CELL.format(paragraph=_paragraph(_run(entry.subtitle, ITALIC_RPR))) +
+            CELL.format(paragraph=_paragraph())
+        )))
+    parts.append(TABLE_END)
+    return "".join(parts)
+
+
+def _bullets(entry: Entry) -> str:
+    return "".join(_paragraph(_run(line), BULLET_PPR) for line in entry.bullets)
+
+
+def _section_header(title: str) -> str:
+    return _paragraph(_run(title.upper(), SECTION_HEADER_RPR), SECTION_HEADER_PPR)
+
+
+def build_document_xml(ir: ResumeIR) -> str:
+    """Serializes the resume IR into word/document.xml."""
+    body: List[str] = [DOCUMENT_START]
+
+    # --- HEADER ---
+    body.append(_paragraph(_run(ir.header.name, NAME_RPR), NAME_PPR))
+    body.append(_paragraph(_run(ir.header.contact_info, CONTACT_RPR), CONTACT_PPR))
+
+    # --- SUMMARY ---
+    if ir.summary:
+        body.append(_section_header("Summary"))
+        body.append(_paragraph(_run(ir.summary), SUMMARY_PPR))
+
+    # --- GENERATORS ---
+
+    def generate_education():
+        if ir.education:
+            body.append(_section_header("Education"))
+            body.extend(_entry_header(entry) for entry in ir.education)
+
+    def generate_experience():
+        if ir.experience:
+            body.append(_section_header("Professional Experience"))
+            for entry in ir.experience:
+                body.append(_entry_header(entry))
+                body.append(_bullets(entry))
+
+    def generate_projects():
+        if ir.projects:
+            body.append(_section_header("Projects"))
+            for entry in ir.projects:
+                body.append(_paragraph(_run(entry.title, BOLD_RPR), TITLE_PPR))
+                body.append(_bullets(entry))
+
+    def generate_skills():
+        if ir.skills:
+            body.append(_section_header("Skills"))
+            for skill in ir.skills:
+                if skill.category is not None:
+                    runs = _run(skill.category + ":", BOLD_RPR) + _run(" " + skill.values)
+                else:
+                    runs = _run(skill.values)
+                body.append(_paragraph(runs, SKILL_PPR))
+
+    def generate_course_work():
+        if ir.course_work:
+            body.append(_section_header("Course Work"))
+            body.extend(_paragraph(_run(item), COURSE_PPR) for item in ir.course_work)
+
+    # Dispatch Map
+    generators = {
+        'education': generate_education,
+        'experience': generate_experience,
+        'projects': generate_projects,
+        'skills': generate_skills,
+        'course_work': generate_course_work
+    }
+
+    # Order processing
+    for section in ir.section_order:
+        if section in generators:
+            generators[section]()
+
+    body.append(DOCUMENT_END)
+    return "".join(body)
+
+
+@reports_render_metrics("ooxml")
+def generate_docx_resume_ooxml(data: Union[dict, ResumeIR], output_path: str, profile: Optional[str] = None):
+    """
+    Fast-path DOCX renderer: same layout as generate_docx_resume, written as raw OOXML parts.
+    Accepts the flat ResumeData dict or an already built ResumeIR.
+    """
+    ir = build_resume_ir(data)
+    document_xml = build_document_xml(ir)
+
+    write_zip(output_path, [
+        ("[Content_Types].xml", CONTENT_TYPES_XML),
+        ("_rels/.rels", PACKAGE_RELS_XML),
+        ("word/_rels/document.xml.rels", DOCUMENT_RELS_XML),
+        ("word/styles.xml", STYLES_XML),
+        ("word/numbering.xml", NUMBERING_XML),
+        ("word/document.xml", document_xml),
+    ], profile)
+    return output_path
@@ -1,19 +1,89 @@
 import re
 import os
 import json
+import time
+import uuid
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import google.generativeai as genai
-from typing import Union, Dict
+from typing import Union, Dict, List, Optional
 from dotenv import load_dotenv
 
+from services.parser import SectionSpan
+from services.skills import extract_skill_lines
+
 load_dotenv()
 
+# Optional latency budget for /process. If Gemini has not answered by then we return the
+# heuristic parse (flagged provisional) and let the model call finish in the background.
+# Off (wait for Gemini) unless set here or per request with ?deadline=: a caller that opts in
+# must poll GET /process/{upgrade_token}, which the bundled frontend does not do.
+ENHANCE_DEADLINE_SECONDS = float(os.getenv("ENHANCE_DEADLINE_SECONDS") or 0) or None
+# How long an upgraded result stays fetchable by its token.
+UPGRADE_TTL_SECONDS = int(os.getenv("UPGRADE_TTL_SECONDS", "900"))
+
+_enhance_pool = ThreadPoolExecutor(
+    max_workers=int(os.getenv("ENHANCE_WORKERS", "8")),
+    thread_name_prefix="gemini-enhance",
+)
+# Gemini calls allowed to be queued or running at once. Past this, /process skips
+# Gemini and answers with the heuristic parse instead of growing the backlog.
+ENHANCE_MAX_BACKLOG = int(os.getenv("ENHANCE_MAX_BACKLOG", "32"))
+_enhance_slots = threading.BoundedSemaphore(ENHANCE_MAX_BACKLOG)
+
+# Upgrade tokens live in this process only: with several uvicorn workers, polling
+# must reach the worker that issued the token (sticky routing), else it gets a 404.
+# token -> {"status": "pending" | "ready" | "failed", "data": dict | None, "created": float, "future": Future}
+_upgrades: Dict[str, dict] = {}
+_upgrades_lock = threading.Lock()
+
 def clean_text(text: str) -> str:
     """Basic text cleaning."""
     text = re.sub(r'\s+', ' ', text).strip()
     return text
 
-def heuristic_parse_resume(text: str) -> dict:
-    """Fall back heuristic parser if Gemini unavailable."""
+# Keyword found by the regex scan -> ResumeData field
+KEYWORD_SECTIONS = {
+    "skills": "skills", "experience": "experience", "education": "education", "projects": "projects",
+    "summary": "summary", "objective": "summary", "course work": "course_work", "coursework": "course_work",
+}
+
+def split_skills(content: str) -> List[str]:
+    """Keeps "Category: a, b" lines intact; splits anything else on commas."""
+    skills = []
+    for line in content.split('\n'):
+        line = line.strip()
+        if ':' in line:
+            skills.append(line)
+        else:
+            skills.extend(s.strip() for s in line.split(',') if s.strip())
+    return skills
+
+def _assign_section(sections: dict, key: str, content: str):
+    if key == "skills":
+        sections["skills"] = split_skills(content)
+    elif key == "summary":
+        sections["summary"] = content
+    elif key in ("experience", "education", "projects", "course_work"):
+        sections[key].append(content)
+
+def heuristic_parse_resume(text: str, spans: Optional[List[SectionSpan]] = None) -> dict:
+    """
+    Fall back heuristic parser if Gemini unavailable.
+    Uses section spans from layout-aware extraction when given, otherwise scans for keywords.
+    Skills are then taken from a taxonomy scan of the whole text, so skills only
+    mentioned in experience bullets are kept too.
+    """
+    sections = _split_sections(text, spans)
+    skill_lines = extract_skill_lines(text, sections["skills"])
+    if skill_lines:
+        sections["skills"] = skill_lines
+    return sections
+
+def _split_sections(text: str, spans: Optional[List[SectionSpan]]) -> dict:
     sections = {
         "contact": "",
         "summary": "",
@@ -24,7 +94,14 @@ def heuristic_parse_resume(text: str) -> dict:
         "course_work": []
     }
     
-    lower_text = text.lower()
+    if spans:
+        # Boundaries already known from the document layout; no rescan.
+        # OTHER_SECTION spans (Publications, Awards, ...) only end the section before them.
+        sections["contact"] = text[:spans[0].heading_start].strip()
+        for span in spans:
+            _assign_section(sections, span.key, text[span.start:span.end].strip())
+        return sections
+    
     keywords = ["skills", "experience", "education", "projects", "summary", "objective", "course work", "coursework"]
     indices = []
     
@@ -48,38 +125,36 @@ def heuristic_parse_resume(text: str) -> dict:
         end = indices[i+1][0] if i+1 < len(indices) else len(text)
         content = text[start:end].strip()
         content = re.sub(r'(?i)^' + key + r'[:\s-]*', '', content).strip()
-        
-        normalized_key = key.lower().replace(" ", "")
-        
-        if normalized_key == "skills":
-            sections["skills"] = [s.strip() for s in content.split(',') if s.strip()]
-        elif normalized_key in ["experience", "workhistory"]:
-            sections["experience"].append(content)
-        elif normalized_key == "education":
-            sections["education"].append(content)
-        elif normalized_key == "projects":
-            sections["projects"].append(content)
-        elif normalized_key in ["summary", "objective"]:
-            sections["summary"] = content
-        elif normalized_key in ["coursework", "course work"]:
-            sections["course_work"].append(content)
+        _assign_section(sections, KEYWORD_SECTIONS[key], content)
             
     return sections
 
-def enhance_content(input_data: Union[str, Dict]) -> dict:
-    """
-    Enhances resume using Gemini API.
-    Accepts raw text (preferred) or pre-parsed dict.
-    """
+def annotate_sections(text: str, spans: List[SectionSpan]) -> str:
+    """Rewrites the resume text with explicit "### SECTION" markers at the detected boundaries."""
+    parts = [text[:spans[0].heading_start].strip()]
+    for span in spans:
+        parts.append(f"### {span.key.upper()} ({span.title})\n{text[span.start:span.end].strip()}")
+    return "\n\n".join(parts)
+
+def gemini_available() -> bool:
+    """True if a usable Gemini API key is configured."""
     api_key = os.getenv("GEMINI_API_KEY")
-    
-    if not api_key or "PLACE_YOUR_KEY" in api_key:
-        print("Gemini API Key missing. Using heuristic.")
-        if isinstance(input_data, str):
-            return heuristic_parse_resume(input_data)
-        return input_data
+    return bool(api_key) and "PLACE_YOUR_KEY" not in api_key
 
-    genai.configure(api_key=api_key)
+def fallback_content(input_data: Union[str, Dict], spans: Optional[List[SectionSpan]] = None) -> dict:
+    """Result used whenever Gemini can't be used: heuristic parse for raw text, passthrough for dicts."""
+    if isinstance(input_data, str):
+        return heuristic_parse_resume(input_data, spans)
+    return input_data
+
+def get_gemini_model():
+    """Configures the client and returns the GenerativeModel to use."""
+    endpoint = os.getenv("GEMINI_API_ENDPOINT")
+    if endpoint:
+        # Alternate endpoint (e.g. the local stand-in used by benchmarks/load_test.py); REST only
+        genai.configure(api_key=os.getenv("GEMINI_API_KEY"), transport="rest", client_options={"api_endpoint": endpoint})
+    else:
+        genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
     
     # Try user requested model first, then standard ones
     models_to_try = ['gemini-2.5-flash-lite', 'gemini-2.0-flash-lite', 'gemini-2.0-flash-exp', 'gemini-1.5-flash']
@@ -99,9 +174,23 @@ def enhance_content(input_data: Union[str, Dict]) -> dict:
             
     if not model:
         model = genai.GenerativeModel('gemini-1.5-flash') # Default fallback
+    return model
+
+def _parse_json_response(response):
+    text = response.text.replace("```json", "").replace("```", "").strip()
+    return json.loads(text)
+
+def gemini_enhance(input_data: Union[str, Dict], spans: Optional[List[SectionSpan]] = None) -> dict:
+    """
+    Runs the Gemini enhancement prompt and returns the parsed JSON.
+    Raises on any API or parsing error; callers decide how to fall back.
+    """
+    model = get_gemini_model()
     
     # Prepare input for prompt
-    if isinstance(input_data, str):
+    if isinstance(input_data, str) and spans:
+        content_block = f"RESUME TEXT (section boundaries detected from the layout are marked with ###):\n{annotate_sections(input_data, spans)}"
+    elif isinstance(input_data, str):
         content_block = f"RESUME TEXT:\n{input_data}"
     else:
         content_block = f"PARSED DATA:\n{json.dumps(input_data)}"
@@ -139,13 +228,211 @@ def enhance_content(input_data: Union[str, Dict]) -> dict:
     {content_block}
     """
     
+    response = model.generate_content(prompt)
+    return _parse_json_response(response)
+
+def enhance_content(input_data: Union[str, Dict], spans: Optional[List[SectionSpan]] = None) -> dict:
+    """
+    Enhances resume using Gemini API.
+    Accepts raw text (preferred) or pre-parsed dict, plus optional section spans for raw text.
+    """
+    if not gemini_available():
+        print("Gemini API Key missing. Using heuristic.")
+        return fallback_content(input_data, spans)
+    
     try:
-        response = model.generate_content(prompt)
-        text = response.text.replace("```json", "").replace("```", "").strip()
-        return json.loads(text)
+        return gemini_enhance(input_data, spans)
     except Exception as e:
         print(f"Gemini Error: {e}")
         # Fallback
-        if isinstance(input_data, str):
-            return heuristic_parse_resume(input_data)
-        return input_data
+        return fallback_content(input_data, spans)
+
+# --- Section-level re-enhancement ---
+
+# Output format per section, matching the full-resume prompt
+SECTION_FORMATS = {
+    "contact": '"Name | Phone | Email | LinkedIn | GitHub | Portfolio" on one line',
+    "summary": "a concise 2-3 sentence professional summary",
+    "skills": '"Category: item, item, ..." (e.g. "Languages: Python, Java")',
+    "experience": '"COMPANY | Role | Dates" on the first line, then one "• " bullet per line',
+    "projects": '"Project Name | Tech Stack" on the first line, then one "• " bullet per line',
+    "education": '"University Name, Degree, GPA, Date"',
+    "course_work": "a comma separated list of courses",
+}
+# Bump when the section prompt changes so stale cache entries are not reused
+SECTION_PROMPT_VERSION = "1"
+SECTION_CACHE_SIZE = int(os.getenv("SECTION_CACHE_SIZE", "4096"))
+
+# sha256(version, section, content) -> enhanced content, LRU ordered
+_section_cache: "OrderedDict[str, str]" = OrderedDict()
+_section_cache_lock = threading.Lock()
+
+def _section_cache_key(section: str, content: str) -> str:
+    return hashlib.sha256(f"{SECTION_PROMPT_VERSION}\0{section}\0{content.strip()}".encode()).hexdigest()
+
+def _section_cache_get(section: str, content: str) -> Optional[str]:
+    key = _section_cache_key(section, content)
+    with _section_cache_lock:
+        value = _section_cache.get(key)
+        if value is not None:
+            _section_cache.move_to_end(key)
+        return value
+
+def _section_cache_put(section: str, content: str, enhanced: str):
+    with _section_cache_lock:
+        # The enhanced text maps to itself: sending back an already polished entry is a cache hit
+        for source in (content, enhanced):
+            key = _section_cache_key(section, source)
+            _section_cache[key] = enhanced
+            _section_cache.move_to_end(key)
+        while len(_section_cache) > SECTION_CACHE_SIZE:
+            _section_cache.popitem(last=False)
+
+def gemini_enhance_section(section: str, items: List[str]) -> List[str]:
+    """
+    Focused prompt for just these entries of one section. Returns one string per item.
+    Raises on API errors or a malformed response.
+    """
+    model = get_gemini_model()
+    prompt = f"""
+    You are an expert FAANG recruiter. Rewrite ONLY the following "{section}" entries of a resume.
+    
+    RULES:
+    - Keep every fact, company, date, metric and technology. DO NOT DELETE CONTENT.
+    - Use strong action verbs, highlight metrics and impact, fix grammar/spelling.
+    - Format each entry as {SECTION_FORMATS[section]}.
+    - Return a JSON array of exactly {len(items)} strings, in the same order as the input.
+    
+    ENTRIES:
+    {json.dumps(items)}
+    """
+    response = model.generate_content(prompt)
+    result = _parse_json_response(response)
+    if not isinstance(result, list) or len(result) != len(items) or not all(isinstance(r, str) for r in result):
+        raise ValueError(f"Expected a JSON array of {len(items)} strings")
+    return result
+
+def enhance_section(section: str, items: List[str]) -> dict:
+    """
+    Re-enhances the entries of a single section. Entries seen before (as input or as
+    a previous output) come from the cache; only the rest are sent to Gemini, in one call.
+    On any Gemini problem the uncached entries are returned unchanged.
+    """
+    results = list(items)
+    misses = []
+    hits = 0
+    for i, item in enumerate(items):
+        if not item.strip():
+            continue
+        cached = _section_cache_get(section, item)
+        if cached is not None:
+            results[i] = cached
+            hits += 1
+        else:
+            misses.append(i)
+
+    enhanced = True
+    if misses:
+        if not gemini_available():
+            print("Gemini API Key missing. Returning section unchanged.")
+            enhanced = False
+        else:
+            try:
+                outputs = gemini_enhance_section(section, [items[i] for i in misses])
+                for i, output in zip(misses, outputs):
+                    results[i] = output
+                    _section_cache_put(section, items[i], output)
+            except Exception as e:
+                print(f"Gemini Error (section {section}): {e}")
+                enhanced = False
+
+    return {
+        "section": section,
+        "items": results,
+        "enhanced": enhanced,
+        "cached": hits,
+        "sent": len(misses) if enhanced else 0,
+    }
+
+def _prune_upgrades():
+    """
+    Drops upgrade entries older than UPGRADE_TTL_SECONDS and cancels their Gemini
+    calls if still queued; nobody can fetch the result any more. Caller holds the lock.
+    """
+    cutoff = time.time() - UPGRADE_TTL_SECONDS
+    for token in [t for t, entry in _upgrades.items() if entry["created"] < cutoff]:
+        _upgrades.pop(token)["future"].cancel()
+
+def _store_upgrade(token: str, future):
+    """Done-callback for a background Gemini call that missed its deadline."""
+    if future.cancelled():
+        return
+    try:
+        data, status = future.result(), "ready"
+        if not isinstance(data, dict):
+            raise ValueError(f"Expected a JSON object, got {type(data).__name__}")
+    except Exception as e:
+        print(f"Gemini Error (background upgrade {token}): {e}")
+        data, status = None, "failed"
+    with _upgrades_lock:
+        if token in _upgrades:
+            _upgrades[token].update(status=status, data=data)
+
+def get_upgrade(token: str) -> Optional[dict]:
+    """Returns the upgrade entry for a token, or None if unknown or expired."""
+    with _upgrades_lock:
+        _prune_upgrades()
+        entry = _upgrades.get(token)
+        return {k: v for k, v in entry.items() if k != "future"} if entry else None
+
+def _heuristic_result(raw_text: str, spans: Optional[List[SectionSpan]], fallback: str, **extra) -> dict:
+    """/process payload when Gemini was not used; `fallback` says why."""
+    return {**heuristic_parse_resume(raw_text, spans), "provisional": False, "enhanced": False,
+            "fallback": fallback, **extra}
+
+async def enhance_content_with_deadline(raw_text: str, deadline: Optional[float] = None,
+                                        spans: Optional[List[SectionSpan]] = None) -> dict:
+    """
+    Deadline-bounded variant of enhance_content for the request path. `deadline` defaults to
+    ENHANCE_DEADLINE_SECONDS; None waits for Gemini.
+    Returns the Gemini result if it arrives within `deadline` seconds. Otherwise returns the
+    heuristic parse with provisional=True and an upgrade_token; the Gemini call keeps running
+    and its result can later be fetched with get_upgrade(token).
+    Every result carries `enhanced` and, when it is the heuristic parse, a `fallback`
+    reason: "no_api_key", "backlog_full", "gemini_error" or "deadline".
+    """
+    if deadline is None:
+        deadline = ENHANCE_DEADLINE_SECONDS
+
+    if not gemini_available():
+        print("Gemini API Key missing. Using heuristic.")
+        return _heuristic_result(raw_text, spans, "no_api_key")
+
+    if not _enhance_slots.acquire(blocking=False):
+        print(f"Gemini backlog full ({ENHANCE_MAX_BACKLOG} calls). Using heuristic.")
+        return _heuristic_result(raw_text, spans, "backlog_full")
+    with _upgrades_lock:
+        _prune_upgrades()
+    future = _enhance_pool.submit(gemini_enhance, raw_text, spans)
+    future.add_done_callback(lambda f: _enhance_slots.release())
+    waiter = asyncio.wrap_future(future)
+    # Errors are read from `future` below; this stops asyncio logging them as never retrieved.
+    waiter.add_done_callback(lambda f: f.cancelled() or f.exception())
+    # asyncio.wait (unlike wait_for) leaves the future running when the timeout hits.
+    done, _ = await asyncio.wait({waiter}, timeout=deadline)
+
+    if done:
+        try:
+            return {**future.result(), "provisional": False, "enhanced": True, "fallback": None}
+        except Exception as e:
+            print(f"Gemini Error: {e}")
+            return _heuristic_result(raw_text, spans, "gemini_error")
+
+    token = str(uuid.uuid4())
+    with _upgrades_lock:
+        _prune_upgrades()
+        _upgrades[token] = {"status": "pending", "data": None, "created": time.time(), "future": future}
+    future.add_done_callback(lambda f: _store_upgrade(token, f))
+
+    print(f"Gemini missed {deadline}s deadline. Returning provisional heuristic result ({token}).")
+    return _heuristic_result(raw_text, spans, "deadline", provisional=True, upgrade_token=token)
@@ -0,0 +1,215 @@
+import os
+import queue
+import threading
+import multiprocessing as mp
+from typing import Optional
+
+try:
+    import resource
+except ImportError:  # Windows: no RLIMIT_AS, workers run without a memory cap
+    resource = None
+
+from services.parser import read_document_layout, extract_document, ExtractedDocument
+
+# Text extraction runs in a pool of pre-started worker processes so a malformed or
+# huge upload can't spin or balloon memory in the API process. Each task gets a
+# wall-clock timeout, each worker an address-space limit, and workers are replaced
+# after EXTRACTION_MAX_TASKS tasks to cap fragmentation / leak growth.
+
+EXTRACTION_WORKERS = int(os.getenv("EXTRACTION_WORKERS", "2"))  # 0 = extract in-process
+EXTRACTION_TIMEOUT_SECONDS = float(os.getenv("EXTRACTION_TIMEOUT_SECONDS", "30"))
+EXTRACTION_MEMORY_LIMIT_MB = int(os.getenv("EXTRACTION_MEMORY_LIMIT_MB", "1024"))  # 0 = unlimited
+EXTRACTION_MAX_TASKS = int(os.getenv("EXTRACTION_MAX_TASKS", "50"))
+# Callers run on Starlette's shared threadpool: bound how many wait for a busy worker, and for how long
+EXTRACTION_MAX_WAITING = int(os.getenv("EXTRACTION_MAX_WAITING", "8"))
+EXTRACTION_QUEUE_TIMEOUT_SECONDS = float(os.getenv("EXTRACTION_QUEUE_TIMEOUT_SECONDS", "10"))
+
+
+class ExtractionError(Exception):
+    """The document could not be extracted safely (timeout, memory limit or crashed worker)."""
+
+
+class ExtractionBusyError(ExtractionError):
+    """Every worker is busy and the wait queue is full or the wait timed out; retry later."""
+
+
+def _worker_main(conn, memory_limit_mb: int, max_tasks: int):
+    """Worker loop: serves up to max_tasks extractions, then exits to be replaced."""
+    if resource is not None and memory_limit_mb:
+        limit = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    for _ in range(max_tasks):
+        try:
+            file_path, filename = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        try:
+            conn.send(("ok", read_document_layout(file_path, filename)))
+        except MemoryError:
+            conn.send(("memory", f"exceeded {memory_limit_mb} MB memory limit"))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+    conn.close()
+
+
+class _Worker:
+    def __init__(self, ctx, memory_limit_mb: int, max_tasks: int):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main,
+            args=(child_conn, memory_limit_mb, max_tasks),
+            name="extraction-worker",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.tasks = 0
+
+    def stop(self):
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=5)
+        self.conn.close()
+
+
+class ExtractionPool:
+    def __init__(self, workers: int = EXTRACTION_WORKERS, timeout: float = EXTRACTION_TIMEOUT_SECONDS,
+                 memory_limit_mb: int = EXTRACTION_MEMORY_LIMIT_MB, max_tasks: int = EXTRACTION_MAX_TASKS,
+                 max_waiting: int = EXTRACTION_MAX_WAITING, queue_timeout: float = EXTRACTION_QUEUE_TIMEOUT_SECONDS):
+        self.workers = workers
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.max_tasks = max_tasks
+        self.max_waiting = max_waiting
+        self.queue_timeout = queue_timeout
+        method = "forkserver" if "forkserver" in mp.get_all_start_methods() else "spawn"
+        self._ctx = mp.get_context(method)
+        if method == "forkserver":
+            # Workers fork from a server that already imported pdfminer / python-docx
+            self._ctx.set_forkserver_preload(["services.parser"])
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._all = set()
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._closed = False
+
+    def _spawn(self) -> _Worker:
+        worker = _Worker(self._ctx, self.memory_limit_mb, self.max_tasks)
+        with self._lock:
+            self._all.add(worker)
+        return worker
+
+    def _retire(self, worker: _Worker):
+        worker.stop()
+        with self._lock:
+            self._all.discard(worker)
+
+    def _release(self, worker: _Worker, replace: bool):
+        if replace:
+            self._retire(worker)
+            if self._closed:
+                return
+            worker = self._spawn()
+        self._idle.put(worker)
+
+    def start(self) -> "ExtractionPool":
+        for _ in range(self.workers):
+            self._idle.put(self._spawn())
+        return self
+
+    def shutdown(self):
+        self._closed = True
+        with self._lock:
+            workers = list(self._all)
+        for worker in workers:
+            self._retire(worker)
+
+    def _acquire(self) -> _Worker:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._waiting >= self.max_waiting:
+                raise ExtractionBusyError(f"All extraction workers busy ({self._waiting} requests waiting)")
+            self._waiting += 1
+        try:
+            return self._idle.get(timeout=self.queue_timeout)
+        except queue.Empty:
+            raise ExtractionBusyError(f"No extraction worker free after {self.queue_timeout:g}s")
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+    def extract(self, file_path: str, filename: str, timeout: Optional[float] = None) -> ExtractedDocument:
+        """
+        Extracts text and section spans in a worker process. While all workers are busy, waits
+        up to queue_timeout behind at most max_waiting other callers, else raises ExtractionBusyError.
+        Returns an empty document for files the reader rejects (same as parser.extract_document);
+        raises ExtractionError on timeout, memory limit or a dead worker.
+        """
+        if self._closed:
+            raise ExtractionError("Extraction pool is shut down")
+        timeout = self.timeout if timeout is None else timeout
+
+        worker = self._acquire()
+        if not worker.process.is_alive():
+            # Died while idle (e.g. OOM killer); swap in a fresh one
+            self._retire(worker)
+            worker = self._spawn()
+
+        replace = True
+        try:
+            worker.conn.send((os.path.abspath(file_path), filename))
+            if not worker.conn.poll(timeout):
+                raise ExtractionError(f"Extraction timed out after {timeout:g}s")
+            try:
+                status, payload = worker.conn.recv()
+            except (EOFError, ConnectionResetError):
+                worker.process.join(timeout=1)
+                raise ExtractionError(f"Extraction worker died (exit code {worker.process.exitcode})")
+
+            worker.tasks += 1
+            if status == "memory":
+                raise ExtractionError(f"Extraction {payload}")
+            replace = worker.tasks >= self.max_tasks
+            if status == "error":
+                print(f"Error reading {filename}: {payload}")
+                return ExtractedDocument("", [])
+            return payload
+        except (BrokenPipeError, OSError) as e:
+            raise ExtractionError(f"Extraction worker unavailable: {e}")
+        finally:
+            self._release(worker, replace)
+
+
+_pool: Optional[ExtractionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_extraction_pool() -> Optional[ExtractionPool]:
+    """Returns the shared pool, starting it on first use. None when EXTRACTION_WORKERS=0."""
+    global _pool
+    if EXTRACTION_WORKERS <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = ExtractionPool().start()
+        return _pool
+
+
+def shutdown_extraction_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
+
+
+def extract_document_isolated(file_path: str, filename: str) -> ExtractedDocument:
+    """Pool-backed drop-in for parser.extract_document. Raises ExtractionError instead of hanging."""
+    pool = get_extraction_pool()
+    if pool is None:
+        return extract_document(file_path, filename)
+    return pool.extract(file_path, filename)
@@ -10,19 +10,28 @@ from docx.shared import Pt, Inches, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
+from typing import Optional, Union
 
-def generate_pdf_resume(data: dict, output_path: str):
+from services.resume_ir import ResumeIR, Entry, build_resume_ir
+from services.output_profile import reports_render_metrics, pdf_options, pdf_canvasmaker, save_docx
+
+@reports_render_metrics("platypus")
+def generate_pdf_resume(data: Union[dict, ResumeIR], output_path: str, profile: Optional[str] = None):
     """
     Generates a FAANG-style PDF resume using ReportLab (Classic Serif Style).
     Reference: Single column, compact, serif typeset.
+    Accepts the flat ResumeData dict or an already built ResumeIR.
+    `profile` selects the output profile (see services.output_profile).
     """
+    ir = build_resume_ir(data)
     doc = SimpleDocTemplate(
         output_path,
         pagesize=LETTER,
         rightMargin=0.5*inch,
         leftMargin=0.5*inch,
         topMargin=0.5*inch,
-        bottomMargin=0.5*inch
+        bottomMargin=0.5*inch,
+        **pdf_options(profile)
     )
     
     styles = getSampleStyleSheet()
@@ -87,164 +96,99 @@ def generate_pdf_resume(data: dict, output_path: str):
         spaceAfter=1
     )
 
+    right_style = ParagraphStyle('Right', parent=body_style, alignment=TA_RIGHT)
+
     story = []
     
     # --- HEADER ---
-    contact_line = data.get('contact', '').strip()
-    # Logic to ensure proper separation if the user provided "Name | Contact..." or just "Contact..."
-    # The prompt usually asks for "Name | Phone..." but if user edits it, it might change.
-    
-    parts = [p.strip() for p in contact_line.split('|')]
-    if len(parts) > 1:
-        # Assuming first part is name
-        name = parts[0]
-        contact_info = " | ".join(parts[1:])
-    else:
-        # Fallback if no pipe separation found, or just name? 
-        # Better safe: treat as Name, empty contact, OR check string length?
-        # Let's assume the user put everything in one line if no pipe, so we split by newlines?
-        if '\n' in contact_line:
-            n_parts = contact_line.split('\n')
-            name = n_parts[0]
-            contact_info = " | ".join(n_parts[1:])
-        else:
-            name = contact_line # Risk: entire contact line becomes Name header
-            contact_info = ""
-
-    story.append(Paragraph(name, name_style))
-    story.append(Paragraph(contact_info, contact_style))
+    story.append(Paragraph(ir.header.name, name_style))
+    story.append(Paragraph(ir.header.contact_info, contact_style))
     
     # Space after contact
     story.append(Spacer(1, 10))
 
     # --- SUMMARY (Fixed Position: 2 lines below) ---
-    if data.get('summary'):
+    if ir.summary:
         story.append(Paragraph("SUMMARY", section_header_style))
         story.append(HRFlowable(width="100%", thickness=1, color=colors.black, spaceAfter=6, spaceBefore=4))
-        story.append(Paragraph(data['summary'], body_style))
+        story.append(Paragraph(ir.summary, body_style))
         story.append(Spacer(1, 12)) # slightly more space after summary section to ensure break
 
     # --- HELPERS ---
     def add_line():
         story.append(HRFlowable(width="100%", thickness=1, color=colors.black, spaceAfter=6, spaceBefore=4))
 
+    def add_entry_header(entry: Entry, bottom_padding: int):
+        # Two-column table only to right-align the date
+        if not entry.has_columns:
+            story.append(Paragraph(f"<b>{entry.title}</b>", body_style))
+            return
+        t_data = [[Paragraph(f"<b>{entry.title}</b>", body_style), Paragraph(entry.date, right_style)]]
+        if entry.subtitle:
+            t_data.append([Paragraph(f"<i>{entry.subtitle}</i>", body_style), ""])
+        
+        t = Table(t_data, colWidths=[5.5*inch, 2*inch])
+        t.setStyle(TableStyle([
+            ('VALIGN', (0,0), (-1,-1), 'TOP'),
+            ('LEFTPADDING', (0,0), (-1,-1), 0),
+            ('RIGHTPADDING', (0,0), (-1,-1), 0),
+            ('BOTTOMPADDING', (0,0), (-1,-1), bottom_padding),
+            ('ALIGN', (0,0), (-1,-1), 'LEFT'),
+            # Cells hold Paragraphs; without this the table still selects Helvetica for every cell
+            ('FONT', (0,0), (-1,-1), 'Times-Roman'),
+        ]))
+        t.hAlign = 'LEFT'
+        story.append(t)
+
+    def add_bullets(entry: Entry):
+        for line in entry.bullets:
+            story.append(Paragraph(f"• {line}", bullet_style))
+
     # --- SECTIONS GENERATORS ---
     
     def generate_education():
-        if data.get('education'):
+        if ir.education:
             story.append(Paragraph("EDUCATION", section_header_style))
             add_line()
-            # ... (rest of implementation unchanged)
-            
-            for edu_item in data['education']:
-                parts = [x.strip() for x in edu_item.split(',')]
-                
-                if len(parts) >= 2:
-                    uni_name = parts[0]
-                    date = parts[-1]
-                    mid = ", ".join(parts[1:-1])
-                    
-                    row1 = [Paragraph(f"<b>{uni_name}</b>", body_style), Paragraph(date, ParagraphStyle('Right', parent=body_style, alignment=TA_RIGHT))]
-                    if mid:
-                        row2 = [Paragraph(f"<i>{mid}</i>", body_style), ""]
-                        data_table = [row1, row2]
-                    else:
-                        data_table = [row1]
-                        
-                    t = Table(data_table, colWidths=[5.5*inch, 2*inch])
-                    t.setStyle(TableStyle([
-                        ('VALIGN', (0,0), (-1,-1), 'TOP'),
-                        ('LEFTPADDING', (0,0), (-1,-1), 0),
-                        ('RIGHTPADDING', (0,0), (-1,-1), 0),
-                        ('BOTTOMPADDING', (0,0), (-1,-1), 0),
-                        ('ALIGN', (0,0), (-1,-1), 'LEFT'),
-                    ]))
-                    t.hAlign = 'LEFT'
-                    story.append(t)
-                else:
-                    story.append(Paragraph(edu_item, body_style))
-                
+            for entry in ir.education:
+                add_entry_header(entry, 0)
                 story.append(Spacer(1, 4))
 
     def generate_experience():
-        if data.get('experience'):
+        if ir.experience:
             story.append(Paragraph("PROFESSIONAL EXPERIENCE", section_header_style))
             add_line()
-            
-            for exp_block in data['experience']:
-                lines = exp_block.split('\n')
-                header_line = lines[0]
-                
-                h_parts = [p.strip() for p in header_line.split('|')]
-                
-                if len(h_parts) >= 3:
-                    company = h_parts[0]
-                    role = h_parts[1]
-                    date = h_parts[2]
-                    
-                    t_data = [[Paragraph(f"<b>{company}</b>", body_style), Paragraph(date, ParagraphStyle('R', parent=body_style, alignment=TA_RIGHT))]]
-                    t_data.append([Paragraph(f"<i>{role}</i>", body_style), ""])
-                    
-                    t = Table(t_data, colWidths=[5.5*inch, 2*inch])
-                    t.setStyle(TableStyle([
-                        ('VALIGN', (0,0), (-1,-1), 'TOP'),
-                        ('LEFTPADDING', (0,0), (-1,-1), 0),
-                        ('RIGHTPADDING', (0,0), (-1,-1), 0),
-                        ('BOTTOMPADDING', (0,0), (-1,-1), 1),
-                        ('ALIGN', (0,0), (-1,-1), 'LEFT'),
-                    ]))
-                    t.hAlign = 'LEFT'
-                    story.append(t)
-                else:
-                    story.append(Paragraph(f"<b>{header_line}</b>", body_style))
-                
-                for line in lines[1:]:
-                    line = line.strip()
-                    if line.startswith('•') or line.startswith('-'):
-                        line = line[1:].strip()
-                    if line:
-                        story.append(Paragraph(f"• {line}", bullet_style))
-                
+            for entry in ir.experience:
+                add_entry_header(entry, 1)
+                add_bullets(entry)
                 story.append(Spacer(1, 8))
 
     def generate_projects():
-        if data.get('projects'):
+        if ir.projects:
             story.append(Paragraph("PROJECTS", section_header_style))
             add_line()
-            
-            for proj_block in data['projects']:
-                lines = proj_block.split('\n')
-                header_line = lines[0]
-                
-                story.append(Paragraph(f"<b>{header_line}</b>", body_style))
-                
-                for line in lines[1:]:
-                    line = line.strip()
-                    if line.startswith('•') or line.startswith('-'):
-                        line = line[1:].strip()
-                    if line:
-                        story.append(Paragraph(f"• {line}", bullet_style))
-                
+            for entry in ir.projects:
+                story.append(Paragraph(f"<b>{entry.title}</b>", body_style))
+                add_bullets(entry)
                 story.append(Spacer(1, 8))
 
     def generate_skills():
-        if data.get('skills'):
+        if ir.skills:
             story.append(Paragraph("SKILLS", section_header_style))
             add_line()
-            for skill_line in data['skills']:
-                if ':' in skill_line:
-                    cat, val = skill_line.split(':', 1)
-                    p = Paragraph(f"<b>{cat}:</b> {val}", body_style)
+            for skill in ir.skills:
+                if skill.category is not None:
+                    p = Paragraph(f"<b>{skill.category}:</b> {skill.values}", body_style)
                 else:
-                    p = Paragraph(skill_line, body_style)
+                    p = Paragraph(skill.values, body_style)
                 story.append(p)
             story.append(Spacer(1, 6))
 
     def generate_course_work():
-        if data.get('course_work'):
+        if ir.course_work:
             story.append(Paragraph("COURSE WORK", section_header_style))
             add_line()
-            for item in data['course_work']:
+            for item in ir.course_work:
                 story.append(Paragraph(item, body_style))
             story.append(Spacer(1, 6))
 
@@ -258,19 +202,21 @@ def generate_pdf_resume(data: dict, output_path: str):
     }
 
     # Order processing
-    order = data.get('section_order', ["education", "skills", "experience", "projects", "course_work"])
-    
-    for section in order:
+    for section in ir.section_order:
         if section in generators:
             generators[section]()
 
-    doc.build(story)
+    doc.build(story, canvasmaker=pdf_canvasmaker(profile))
     return output_path
 
-def generate_docx_resume(data: dict, output_path: str):
+@reports_render_metrics("python-docx")
+def generate_docx_resume(data: Union[dict, ResumeIR], output_path: str, profile: Optional[str] = None):
     """
     Generates a FAANG-style DOCX resume matching the PDF design.
+    Accepts the flat ResumeData dict or an already built ResumeIR.
+    `profile` selects the output profile (see services.output_profile).
     """
+    ir = build_resume_ir(data)
     doc = Document()
     
     # Styles
@@ -309,24 +255,75 @@ def generate_docx_resume(data: dict, output_path: str):
         p.paragraph_format.space_before = Pt(12)
         p.paragraph_format.space_after = Pt(4)
 
-    # --- HEADER ---
-    contact_line = data.get('contact', '').strip()
-    parts = [p.strip() for p in contact_line.split('|')]
-    if len(parts) > 1:
-        name = parts[0]
-        contact_info = " | ".join(parts[1:])
-    else:
-        if '\n' in contact_line:
-            n_parts = contact_line.split('\n')
-            name = n_parts[0]
-            contact_info = " | ".join(n_parts[1:])
-        else:
-            name = contact_line
-            contact_info = ""
+    def zero_left_margin(cell):
+        tcPr = cell._tc.get_or_add_tcPr()
+        tcMar = OxmlElement('w:tcMar')
+        left = OxmlElement('w:left')
+        left.set(qn('w:w'), "0")
+        left.set(qn('w:type'), "dxa")
+        tcMar.append(left)
+        tcPr.append(tcMar)
+
+    # Helper for the bold title / italic subtitle / right-aligned date block
+    def add_entry_header(entry: Entry):
+        if not entry.has_columns:
+            p = doc.add_paragraph()
+            p.paragraph_format.space_before = Pt(4)
+            p.paragraph_format.space_after = Pt(1)
+            r = p.add_run(entry.title)
+            r.bold = True
+            r.font.name = 'Times New Roman'
+            return
 
+        # Use a table for the header line to ensure alignment
+        table = doc.add_table(rows=0, cols=2)
+        table.autofit = False
+        # Force table to not indent
+        tblPr = table._element.tblPr
+        tblInd = OxmlElement('w:tblInd')
+        tblInd.set(qn('w:w'), "0")
+        tblInd.set(qn('w:type'), "dxa")
+        tblPr.append(tblInd)
+        
+        row_cells = table.add_row().cells
+        for cell in row_cells:
+            zero_left_margin(cell)
+
+        # Cell 0: Title
+        p_title = row_cells[0].paragraphs[0]
+        r_title = p_title.add_run(entry.title)
+        r_title.bold = True
+        r_title.font.name = 'Times New Roman'
+        
+        # Cell 1: Date (Right Aligned)
+        p_date = row_cells[1].paragraphs[0]
+        r_date = p_date.add_run(entry.date)
+        r_date.font.name = 'Times New Roman'
+        p_date.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+        
+        # Row 2: Subtitle (Degree / Role)
+        if entry.subtitle:
+            row_cells2 = table.add_row().cells
+            for cell in row_cells2:
+                zero_left_margin(cell)
+            p_sub = row_cells2[0].paragraphs[0]
+            r_sub = p_sub.add_run(entry.subtitle)
+            r_sub.italic = True
+            r_sub.font.name = 'Times New Roman'
+
+    def add_bullets(entry: Entry):
+        for line in entry.bullets:
+            p = doc.add_paragraph()
+            p.paragraph_format.left_indent = Inches(0.2)
+            p.paragraph_format.space_after = Pt(1)
+            p.style = 'List Bullet'
+            run = p.add_run(line)
+            run.font.name = 'Times New Roman'
+
+    # --- HEADER ---
     h1 = doc.add_paragraph()
     h1.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = h1.add_run(name)
+    run = h1.add_run(ir.header.name)
     run.bold = True
     run.font.size = Pt(24)
     run.font.name = 'Times New Roman'
@@ -334,13 +331,13 @@ def generate_docx_resume(data: dict, output_path: str):
     
     p_contact = doc.add_paragraph()
     p_contact.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run_c = p_contact.add_run(contact_info)
+    run_c = p_contact.add_run(ir.header.contact_info)
     run_c.font.size = Pt(10)
     run_c.font.name = 'Times New Roman'
     p_contact.paragraph_format.space_after = Pt(10) # 10pt space
 
     # --- SUMMARY (Fixed Position: 2 lines ~ 20pt) ---
-    if data.get('summary'):
+    if ir.summary:
         # Add extra spacing to simulate "2 lines below"
         # We already have space_after=10 on contact.
         # Add section header already adds space_before=12.
@@ -349,193 +346,57 @@ def generate_docx_resume(data: dict, output_path: str):
         add_section_header("Summary")
         p = doc.add_paragraph()
         p.paragraph_format.space_after = Pt(12)
-        run = p.add_run(data['summary'])
+        run = p.add_run(ir.summary)
         run.font.name = 'Times New Roman'
 
 
     # --- GENERATORS ---
     
     def generate_education():
-        if data.get('education'):
+        if ir.education:
             add_section_header("Education")
-            
-            table = doc.add_table(rows=0, cols=2)
-            table.autofit = False
-            # Force table to not indent
-            tblPr = table._element.tblPr
-            tblInd = OxmlElement('w:tblInd')
-            tblInd.set(qn('w:w'), "0")
-            tblInd.set(qn('w:type'), "dxa")
-            tblPr.append(tblInd)
-            
-            for item in data['education']:
-                parts = [x.strip() for x in item.split(',')]
-                uni_name = parts[0] if parts else item
-                date = parts[-1] if len(parts) > 1 else ""
-                mid = ", ".join(parts[1:-1]) if len(parts) > 2 else ""
-
-                row_cells = table.add_row().cells
-                # Force zero margins
-                for cell in row_cells:
-                    tcPr = cell._tc.get_or_add_tcPr()
-                    tcMar = OxmlElement('w:tcMar')
-                    left = OxmlElement('w:left')
-                    left.set(qn('w:w'), "0")
-                    left.set(qn('w:type'), "dxa")
-                    tcMar.append(left)
-                    tcPr.append(tcMar)
-
-                # Cell 0: Uni Name + Degree
-                p1 = row_cells[0].paragraphs[0]
-                r1 = p1.add_run(uni_name)
-                r1.bold = True
-                r1.font.name = 'Times New Roman'
-                
-                # Cell 1: Date (Right Aligned)
-                p2 = row_cells[1].paragraphs[0]
-                r2 = p2.add_run(date)
-                r2.font.name = 'Times New Roman'
-                p2.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-                
-                # Row 2 for Degree if exists
-                if mid:
-                    row_cells2 = table.add_row().cells
-                    for cell in row_cells2:
-                        tcPr = cell._tc.get_or_add_tcPr()
-                        tcMar = OxmlElement('w:tcMar')
-                        left = OxmlElement('w:left')
-                        left.set(qn('w:w'), "0")
-                        left.set(qn('w:type'), "dxa")
-                        tcMar.append(left)
-                        tcPr.append(tcMar)
-                        
-                    p3 = row_cells2[0].paragraphs[0]
-                    r3 = p3.add_run(mid)
-                    r3.italic = True
-                    r3.font.name = 'Times New Roman'
+            for entry in ir.education:
+                add_entry_header(entry)
 
     def generate_experience():
-        if data.get('experience'):
+        if ir.experience:
             add_section_header("Professional Experience")
-            
-            for exp in data['experience']:
-                lines = exp.split('\n')
-                header_line = lines[0]
-                h_parts = [p.strip() for p in header_line.split('|')]
-                
-                company = h_parts[0] if h_parts else header_line
-                role = h_parts[1] if len(h_parts) > 1 else ""
-                date = h_parts[2] if len(h_parts) > 2 else ""
-
-                # Use a table for the header line to ensure alignment
-                table = doc.add_table(rows=0, cols=2)
-                table.autofit = False
-                # Force table to not indent
-                tblPr = table._element.tblPr
-                tblInd = OxmlElement('w:tblInd')
-                tblInd.set(qn('w:w'), "0")
-                tblInd.set(qn('w:type'), "dxa")
-                tblPr.append(tblInd)
-                
-                row_cells = table.add_row().cells
-                
-                # Zero padding cell 0
-                tcPr = row_cells[0]._tc.get_or_add_tcPr()
-                tcMar = OxmlElement('w:tcMar')
-                left = OxmlElement('w:left')
-                left.set(qn('w:w'), "0")
-                left.set(qn('w:type'), "dxa")
-                tcMar.append(left)
-                tcPr.append(tcMar)
-
-                p_comp = row_cells[0].paragraphs[0]
-                r_comp = p_comp.add_run(company)
-                r_comp.bold = True
-                r_comp.font.name = 'Times New Roman'
-                
-                # Cell 1: Date
-                p_date = row_cells[1].paragraphs[0]
-                r_date = p_date.add_run(date)
-                r_date.font.name = 'Times New Roman'
-                p_date.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-                
-                # Row 2: Role
-                if role:
-                    row_cells2 = table.add_row().cells
-                    
-                    tcPr2 = row_cells2[0]._tc.get_or_add_tcPr()
-                    tcMar2 = OxmlElement('w:tcMar')
-                    left2 = OxmlElement('w:left')
-                    left2.set(qn('w:w'), "0")
-                    left2.set(qn('w:type'), "dxa")
-                    tcMar2.append(left2)
-                    tcPr2.append(tcMar2)
-                    
-                    p_role = row_cells2[0].paragraphs[0]
-                    r_role = p_role.add_run(role)
-                    r_role.italic = True
-                    r_role.font.name = 'Times New Roman'
-                    
-                # Bullets
-                for line in lines[1:]:
-                    line = line.strip()
-                    if line.startswith('•') or line.startswith('-'):
-                        line = line[1:].strip()
-                    if line:
-                        p = doc.add_paragraph()
-                        p.paragraph_format.left_indent = Inches(0.2)
-                        p.paragraph_format.space_after = Pt(1)
-                        p.style = 'List Bullet'
-                        run = p.add_run(line)
-                        run.font.name = 'Times New Roman'
+            for entry in ir.experience:
+                add_entry_header(entry)
+                add_bullets(entry)
 
     def generate_projects():
-        if data.get('projects'):
+        if ir.projects:
             add_section_header("Projects")
-            for proj in data['projects']:
-                lines = proj.split('\n')
-                header = lines[0]
-                
+            for entry in ir.projects:
                 p = doc.add_paragraph()
                 p.paragraph_format.space_before = Pt(4)
                 p.paragraph_format.space_after = Pt(1)
-                r = p.add_run(header)
+                r = p.add_run(entry.title)
                 r.bold = True
                 r.font.name = 'Times New Roman'
-                
-                for line in lines[1:]:
-                    line = line.strip()
-                    if line.startswith('•') or line.startswith('-'):
-                        line = line[1:].strip()
-                    if line:
-                        p = doc.add_paragraph()
-                        p.paragraph_format.left_indent = Inches(0.2)
-                        p.paragraph_format.space_after = Pt(1)
-                        p.style = 'List Bullet'
-                        run = p.add_run(line)
-                        run.font.name = 'Times New Roman'
+                add_bullets(entry)
 
     def generate_skills():
-        if data.get('skills'):
+        if ir.skills:
             add_section_header("Skills")
-            for skill_line in data['skills']:
+            for skill in ir.skills:
                 p = doc.add_paragraph()
                 p.paragraph_format.space_after = Pt(1)
-                if ':' in skill_line:
-                    cat, val = skill_line.split(':', 1)
-                    r_cat = p.add_run(cat + ":")
+                if skill.category is not None:
+                    r_cat = p.add_run(skill.category + ":")
                     r_cat.bold = True
                     r_cat.font.name = 'Times New Roman'
-                    r_val = p.add_run(val)
+                    r_val = p.add_run(" " + skill.values)
                     r_val.font.name = 'Times New Roman'
                 else:
-                    r = p.add_run(skill_line)
+                    r = p.add_run(skill.values)
                     r.font.name = 'Times New Roman'
 
     def generate_course_work():
-        if data.get('course_work'):
+        if ir.course_work:
             add_section_header("Course Work")
-            for item in data['course_work']:
+            for item in ir.course_work:
                 p = doc.add_paragraph()
                 p.paragraph_format.left_indent = Inches(0.15)
                 p.paragraph_format.space_after = Pt(1)
@@ -552,11 +413,18 @@ def generate_docx_resume(data: dict, output_path: str):
     }
     
     # Order processing
-    order = data.get('section_order', ["education", "skills", "experience", "projects", "course_work"])
-    
-    for section in order:
+    for section in ir.section_order:
         if section in generators:
             generators[section]()
             
-    doc.save(output_path)
+    save_docx(doc, output_path, profile)
     return output_path
+
+def generate_resume_bundle(data: Union[dict, ResumeIR], pdf_path: str, docx_path: str, profile: Optional[str] = None):
+    """
+    Renders PDF and DOCX from a single parse of the resume data.
+    Sequential on purpose: both renderers are CPU-bound Python, so threads only add GIL contention.
+    Returns (pdf_path, docx_path).
+    """
+    ir = build_resume_ir(data)
+    return generate_pdf_resume(ir, pdf_path, profile), generate_docx_resume(ir, docx_path, profile)
@@ -0,0 +1,196 @@
+import os
+import re
+import math
+import json
+import hashlib
+import threading
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+import numpy as np
+import scipy.sparse as sp
+
+# Job-description match scoring over many resumes at once.
+# Resumes (skills, experience, projects) become rows of a sparse, L2-normalised
+# TF-IDF matrix that is built once per resume set and cached. Job descriptions
+# are vectorised against the same vocabulary, and every resume x job pair is
+# scored with a single sparse matrix product (cosine similarity).
+
+MATCH_FIELDS = ("skills", "experience", "projects")
+MATCH_KEYWORDS = int(os.getenv("MATCH_KEYWORDS", "15"))  # top job terms reported as matched / missing
+MATCH_INDEX_CACHE_SIZE = int(os.getenv("MATCH_INDEX_CACHE_SIZE", "8"))
+
+# Keeps tech tokens intact: c++, c#, node.js, ci/cd -> "ci", "cd", scikit-learn
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:[.\-][a-z0-9+#]+)*")
+STOPWORDS = frozenset("""
+a about above across after all also an and any are as at be been being both but by can could did do does
+during each either etc for from had has have having he her his how i if in into is it its itself more most
+my no not of on or our ours out over own per same she should so some such than that the their them then
+there these they this those through to too under up us using very via was we were what when where which
+while who whom why will with within would you your
+ability experience including strong work working years year plus preferred required requirements
+""".split())
+
+
+def term_counts(text: str) -> Counter:
+    """Lowercased term -> count; drops stopwords and tokens without a letter (numbers, dates, metrics)."""
+    counts = Counter(TOKEN_RE.findall(text.lower()))
+    # Filter unique tokens only: a resume repeats most of its words
+    for token in [t for t in counts if t in STOPWORDS or not _has_letter(t)]:
+        del counts[token]
+    return counts
+
+
+@lru_cache(maxsize=65536)
+def _has_letter(token: str) -> bool:
+    return any(c.isalpha() for c in token)
+
+
+def resume_text(resume: dict) -> str:
+    """Concatenates the fields that are scored; accepts ResumeData dicts."""
+    parts = []
+    for field in MATCH_FIELDS:
+        value = resume.get(field) or []
+        parts.extend([value] if isinstance(value, str) else value)
+    return "\n".join(parts)
+
+
+class ResumeIndex:
+    """
+    Sparse TF-IDF matrix over a fixed set of resumes.
+
+    Term frequency is sublinear (1 + log tf), idf is smoothed
+    (log((1 + n) / (1 + df)) + 1), rows are L2-normalised, so a dot product
+    with a normalised job vector is the cosine similarity.
+    """
+
+    def __init__(self, texts: List[str]):
+        self.vocabulary: Dict[str, int] = {}
+        indptr = [0]
+        indices: List[int] = []
+        counts: List[int] = []
+        for text in texts:
+            for term, count in term_counts(text).items():
+                indices.append(self.vocabulary.setdefault(term, len(self.vocabulary)))
+                counts.append(count)
+            indptr.append(len(indices))
+
+        self.size = len(texts)
+        tf = sp.csr_matrix(
+            (np.asarray(counts, dtype=np.float64), np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int64)),
+            shape=(self.size, len(self.vocabulary)),
+        )
+        df = np.bincount(tf.indices, minlength=len(self.vocabulary))
+        self.idf = np.log((1 + self.size) / (1 + df)) + 1
+        # Weight for job terms no resume contains; they only lower the job vector's norm
+        self.unseen_idf = math.log(1 + self.size) + 1
+
+        tf.data = 1 + np.log(tf.data)
+        self.matrix = _normalize_rows(tf @ sp.diags(self.idf))
+        self.terms = np.array(list(self.vocabulary), dtype=object)
+
+    @classmethod
+    def from_resumes(cls, resumes: List[dict]) -> "ResumeIndex":
+        return cls([resume_text(r) for r in resumes])
+
+    def vectorize(self, jobs: List[str]):
+        """
+        Job descriptions -> (M x V normalised CSR matrix, per job list of (term, weight) by weight).
+        Terms missing from the vocabulary still count towards the norm and the keyword list.
+        """
+        indptr = [0]
+        indices: List[int] = []
+        data: List[float] = []
+        norms = []
+        job_terms = []
+        for job in jobs:
+            weighted = []
+            for term, count in term_counts(job).items():
+                col = self.vocabulary.get(term)
+                weight = (1 + math.log(count)) * (self.unseen_idf if col is None else self.idf[col])
+                weighted.append((term, weight))
+                if col is not None:
+                    indices.append(col)
+                    data.append(weight)
+            indptr.append(len(indices))
+            norms.append(math.sqrt(sum(w * w for _, w in weighted)) or 1.0)
+            weighted.sort(key=lambda tw: -tw[1])
+            job_terms.append(weighted)
+
+        matrix = sp.csr_matrix(
+            (np.asarray(data, dtype=np.float64), np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int64)),
+            shape=(len(jobs), len(self.vocabulary)),
+        )
+        return sp.diags(1 / np.asarray(norms)) @ matrix, job_terms
+
+    def score(self, job_matrix) -> np.ndarray:
+        """Dense M x N cosine similarities from one sparse product."""
+        return (job_matrix @ self.matrix.T).toarray()
+
+    def resume_terms(self, row: int) -> set:
+        start, end = self.matrix.indptr[row], self.matrix.indptr[row + 1]
+        return set(self.terms[self.matrix.indices[start:end]])
+
+    def rank(self, jobs: List[str], top_k: Optional[int] = None, keywords: int = MATCH_KEYWORDS) -> List[List[dict]]:
+        """
+        For each job description, the best `top_k` resumes (all when None) by score, with the
+        job's top keywords split into matched / missing for that resume.
+        """
+        job_matrix, job_terms = self.vectorize(jobs)
+        scores = self.score(job_matrix)
+        k = self.size if top_k is None else min(top_k, self.size)
+
+        results = []
+        for j, row in enumerate(scores):
+            if k < self.size:
+                best = np.argpartition(-row, k - 1)[:k] if k else np.empty(0, dtype=np.int64)
+                best = best[np.argsort(-row[best], kind="stable")]
+            else:
+                best = np.argsort(-row, kind="stable")
+            top_terms = [term for term, _ in job_terms[j][:keywords]]
+            ranked = []
+            for i in best:
+                present = self.resume_terms(i)
+                ranked.append({
+                    "resume": int(i),
+                    "score": round(float(row[i]), 4),
+                    "matched": [t for t in top_terms if t in present],
+                    "missing": [t for t in top_terms if t not in present],
+                })
+            results.append(ranked)
+        return results
+
+
+def _normalize_rows(matrix) -> sp.csr_matrix:
+    matrix = sp.csr_matrix(matrix)
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sp.diags(1 / norms) @ matrix
+
+
+# Resume-set hash -> ResumeIndex, LRU ordered
+_index_cache: "OrderedDict[str, ResumeIndex]" = OrderedDict()
+_index_cache_lock = threading.Lock()
+
+
+def get_resume_index(resumes: List[dict]) -> ResumeIndex:
+    """Returns the cached index for this exact set of resumes, building it on first use."""
+    key = hashlib.sha256(json.dumps([[r.get(f) for f in MATCH_FIELDS] for r in resumes]).encode()).hexdigest()
+    with _index_cache_lock:
+        index = _index_cache.get(key)
+        if index is not None:
+            _index_cache.move_to_end(key)
+            return index
+
+    index = ResumeIndex.from_resumes(resumes)
+    with _index_cache_lock:
+        _index_cache[key] = index
+        while len(_index_cache) > MATCH_INDEX_CACHE_SIZE:
+            _index_cache.popitem(last=False)
+    return index
+
+
+def match_resumes(resumes: List[dict], jobs: List[str], top_k: Optional[int] = None) -> List[List[dict]]:
+    """Ranks resumes against each job description; see ResumeIndex.rank."""
+    return get_resume_index(resumes).rank(jobs, top_k)
@@ -0,0 +1,232 @@
+import io
+import os
+import re
+import time
+import zipfile
+import threading
+from dataclasses import dataclass
+from functools import partial, wraps
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from reportlab import rl_config
+from reportlab.pdfgen import canvas
+from docx.oxml.ns import qn
+from lxml import etree
+
+# Output profiles shared by every PDF / DOCX renderer.
+#   standard: library defaults (timestamped metadata, ASCII85 + Flate PDF streams,
+#             python-docx's full template package, default zip compression).
+#   compact:  byte-stable and smaller. PDFs use Flate-only streams, invariant dates
+#             and document ID, and no unused Helvetica font resource; DOCX packages
+#             keep only the styles / fonts / parts the resume uses and are zipped at
+#             level 9 with fixed member timestamps.
+# Each render is timed and its size recorded per (renderer, profile).
+
+STANDARD = "standard"
+COMPACT = "compact"
+OUTPUT_PROFILES = (STANDARD, COMPACT)
+OUTPUT_PROFILE = os.getenv("OUTPUT_PROFILE", COMPACT)
+
+PDF_BASE_FONT = "Times-Roman"
+# Earliest timestamp a zip entry can hold; used for every member in the compact profile
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+# Parts of python-docx's default template the resume never uses
+DOCX_DROPPED_RELTYPES = {
+    "http://schemas.microsoft.com/office/2007/relationships/stylesWithEffects",
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/customXml",
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/webSettings",
+    "http://schemas.openxmlformats.org/package/2006/relationships/metadata/thumbnail",
+}
+
+
+def resolve_profile(profile: Optional[str] = None) -> str:
+    """Defaults to OUTPUT_PROFILE; raises ValueError for unknown names."""
+    profile = (profile or OUTPUT_PROFILE).lower()
+    if profile not in OUTPUT_PROFILES:
+        raise ValueError(f"Unknown output profile '{profile}'. Use one of: {', '.join(OUTPUT_PROFILES)}")
+    return profile
+
+
+# --- PDF ---
+
+# rl_config.useA85 is a process-wide flag, read while a document is serialised
+_DEFAULT_USE_A85 = rl_config.useA85
+_a85_lock = threading.Lock()
+
+
+class ProfileCanvas(canvas.Canvas):
+    """Canvas that serialises with the profile's stream encoding, independent of other renders."""
+
+    def __init__(self, *args, profile: str = STANDARD, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._use_a85 = _DEFAULT_USE_A85 if profile == STANDARD else 0
+
+    def save(self):
+        with _a85_lock:
+            rl_config.useA85 = self._use_a85
+            try:
+                super().save()
+            finally:
+                rl_config.useA85 = _DEFAULT_USE_A85
+
+
+def pdf_options(profile: str) -> dict:
+    """Extra Canvas / DocTemplate keyword arguments for the profile."""
+    if profile == COMPACT:
+        return {"invariant": 1, "pageCompression": 1, "initialFontName": PDF_BASE_FONT}
+    return {}
+
+
+def pdf_canvasmaker(profile: str):
+    """canvasmaker for DocTemplate.build."""
+    return partial(ProfileCanvas, profile=profile)
+
+
+# --- DOCX ---
+
+def write_zip(output_path: str, members: Iterable[Tuple[str, Union[str, bytes]]], profile: str):
+    """Writes a zip package; deterministic and maximally compressed in the compact profile."""
+    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data in members:
+            if profile == COMPACT:
+                info = zipfile.ZipInfo(name, ZIP_EPOCH)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                info.external_attr = 0o644 << 16
+                zf.writestr(info, data, compresslevel=9)
+            else:
+                zf.writestr(name, data)
+
+
+def _used_style_ids(document_element, styles_element) -> set:
+    used = {el.get(qn("w:val")) for tag in ("w:pStyle", "w:rStyle", "w:tblStyle")
+            for el in document_element.iter(qn(tag))}
+    styles = {s.get(qn("w:styleId")): s for s in styles_element.iterchildren(qn("w:style"))}
+    used.update(sid for sid, s in styles.items() if s.get(qn("w:default")) == "1")
+    # Close over basedOn / link chains
+    pending = list(used)
+    while pending:
+        style = styles.get(pending.pop())
+        if style is None:
+            continue
+        for tag in ("w:basedOn", "w:link"):
+            ref = style.find(qn(tag))
+            if ref is not None and ref.get(qn("w:val")) not in used:
+                used.add(ref.get(qn("w:val")))
+                pending.append(ref.get(qn("w:val")))
+    return used
+
+
+def compact_docx(doc) -> set:
+    """
+    Strips a python-docx Document down to what the resume uses: unused styles and
+    latent styles, and the template's thumbnail, customXml, webSettings and
+    stylesWithEffects parts. Returns the font names still referenced, for the fontTable.
+    """
+    document_part = doc.part
+    styles_element = doc.styles.element
+    used = _used_style_ids(document_part.element, styles_element)
+    for style in list(styles_element.iterchildren(qn("w:style"))):
+        if style.get(qn("w:styleId")) not in used:
+            styles_element.remove(style)
+    for latent in styles_element.findall(qn("w:latentStyles")):
+        styles_element.remove(latent)
+
+    for rels in (document_part.rels, document_part.package.rels):
+        for r_id, rel in list(rels.items()):
+            if rel.reltype in DOCX_DROPPED_RELTYPES:
+                rels.pop(r_id)
+
+    # Fonts named in the kept styles / body, plus the theme's major / minor fonts
+    fonts = set()
+    for element in (styles_element, document_part.element):
+        for rfonts in element.iter(qn("w:rFonts")):
+            fonts.update(v for k, v in rfonts.attrib.items() if not k.lower().endswith("theme"))
+    for rel in document_part.rels.values():
+        if not rel.is_external and rel.reltype.endswith("/theme"):
+            fonts.update(f.decode() for f in re.findall(rb'<a:latin typeface="([^"]*)"', rel.target_part.blob))
+    return fonts
+
+
+def _prune_font_table(xml: bytes, fonts: set) -> bytes:
+    root = etree.fromstring(xml)
+    for font in list(root.iterchildren(qn("w:font"))):
+        if font.get(qn("w:name")) not in fonts:
+            root.remove(font)
+    return etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def save_docx(doc, output_path: str, profile: str):
+    """Saves a python-docx Document with the profile applied."""
+    if profile != COMPACT:
+        doc.save(output_path)
+        return
+    fonts = compact_docx(doc)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    with zipfile.ZipFile(buffer) as src:
+        members = [(info.filename, src.read(info)) for info in src.infolist()]
+    members = [(name, _prune_font_table(data, fonts) if name == "word/fontTable.xml" else data)
+               for name, data in members]
+    write_zip(output_path, members, profile)
+
+
+# --- Render metrics ---
+
+@dataclass
+class RenderStats:
+    __slots__ = ("renders", "total_bytes", "total_ms", "last_bytes", "last_ms")
+    renders: int
+    total_bytes: int
+    total_ms: float
+    last_bytes: int
+    last_ms: float
+
+
+_render_stats: Dict[Tuple[str, str], RenderStats] = {}
+_render_stats_lock = threading.Lock()
+
+
+def record_render(renderer: str, profile: str, output_path: str, elapsed_ms: float):
+    size = os.path.getsize(output_path)
+    with _render_stats_lock:
+        stats = _render_stats.get((renderer, profile))
+        if stats is None:
+            stats = _render_stats[(renderer, profile)] = RenderStats(0, 0, 0.0, 0, 0.0)
+        stats.renders += 1
+        stats.total_bytes += size
+        stats.total_ms += elapsed_ms
+        stats.last_bytes = size
+        stats.last_ms = elapsed_ms
+
+
+def reports_render_metrics(renderer: str):
+    """
+    Decorator for generate_*(data, output_path, profile=None) renderers: resolves the
+    profile, times the render and records the output size under (renderer, profile).
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(data, output_path: str, profile: Optional[str] = None):
+            profile = resolve_profile(profile)
+            start = time.perf_counter()
+            result = fn(data, output_path, profile)
+            record_render(renderer, profile, output_path, (time.perf_counter() - start) * 1000)
+            return result
+        return wrapper
+    return decorator
+
+
+def get_render_metrics() -> List[dict]:
+    """Per (renderer, profile): render count, average / last output bytes and render time."""
+    with _render_stats_lock:
+        items = sorted(_render_stats.items())
+        return [{
+            "renderer": renderer,
+            "profile": profile,
+            "renders": s.renders,
+            "avg_bytes": round(s.total_bytes / s.renders),
+            "avg_ms": round(s.total_ms / s.renders, 2),
+            "last_bytes": s.last_bytes,
+            "last_ms": round(s.last_ms, 2),
+        } for (renderer, profile), s in items]
@@ -1,12 +1,203 @@
+import re
+import statistics
 import pdfminer.high_level
+from pdfminer.layout import LTTextBox, LTTextLine, LTChar
 import docx
+from docx.table import Table
 import os
+from dataclasses import dataclass
+from typing import List, Optional
+
+# Heading text (normalized) -> ResumeData section key
+SECTION_HEADINGS = {
+    "summary": "summary", "professional summary": "summary", "objective": "summary",
+    "career objective": "summary", "profile": "summary", "about me": "summary",
+    "skills": "skills", "technical skills": "skills", "core competencies": "skills",
+    "technologies": "skills", "skills & interests": "skills", "skills and interests": "skills",
+    "experience": "experience", "professional experience": "experience", "work experience": "experience",
+    "work history": "experience", "employment": "experience", "employment history": "experience",
+    "education": "education", "academic background": "education",
+    "projects": "projects", "personal projects": "projects", "academic projects": "projects",
+    "key projects": "projects",
+    "coursework": "course_work", "course work": "course_work", "relevant coursework": "course_work",
+    "relevant course work": "course_work",
+}
+
+# Key for headings outside SECTION_HEADINGS (Publications, Awards, ...). Such a span ends the
+# section before it; its content is not mapped to a ResumeData field.
+OTHER_SECTION = "other"
+
+# Common resume headings with no ResumeData field. Any other unknown line needs the size test
+# below: a bold all-caps line on its own is as likely to be an employer ("GOOGLE") or school.
+OTHER_HEADINGS = {
+    "publications", "selected publications", "patents", "awards", "honors", "honors & awards",
+    "awards & honors", "honors and awards", "awards and honors", "achievements", "accomplishments",
+    "certifications", "certificates", "licenses & certifications", "licenses and certifications",
+    "volunteering", "volunteer experience", "volunteer work", "activities", "extracurricular activities",
+    "leadership & activities", "interests", "hobbies", "hobbies & interests", "references",
+    "affiliations", "professional affiliations", "memberships", "talks", "presentations", "conferences",
+}
+
+# A line this much larger than the body text is a heading even without a known title
+HEADING_SIZE_RATIO = 1.15
+MAX_HEADING_WORDS = 5
+
+@dataclass
+class SectionSpan:
+    """A detected section: `key` is a ResumeData field, its content is text[start:end]."""
+    __slots__ = ("key", "title", "heading_start", "start", "end")
+    key: str
+    title: str
+    heading_start: int
+    start: int
+    end: int
+
+@dataclass
+class ExtractedDocument:
+    __slots__ = ("text", "sections")
+    text: str
+    sections: List[SectionSpan]
+
+def normalize_heading(text: str) -> str:
+    text = re.sub(r'[^a-z& ]+', ' ', text.lower())
+    return re.sub(r'\s+', ' ', text).strip()
+
+def classify_heading(text: str, size: float, bold: bool, body_size: float, first_in_block: bool) -> Optional[str]:
+    """
+    Returns the section key if a line looks like a section heading, else None.
+    OTHER_SECTION for a heading in OTHER_HEADINGS, or for any other title-like line that is
+    HEADING_SIZE_RATIO larger than the body text.
+    """
+    stripped = text.strip().rstrip(':')
+    if not stripped or len(stripped.split()) > MAX_HEADING_WORDS or not first_in_block:
+        return None
+    normalized = normalize_heading(stripped)
+    key = SECTION_HEADINGS.get(normalized)
+    emphasized = bold or stripped.isupper() or size >= body_size * HEADING_SIZE_RATIO
+    if key and emphasized:
+        return key
+    if normalized in OTHER_HEADINGS and emphasized:
+        return OTHER_SECTION
+    # Titles only: no digits or separators, so "ACME | 2019" stays an entry line
+    if size >= body_size * HEADING_SIZE_RATIO and normalized == re.sub(r'\s+', ' ', stripped.lower()):
+        return OTHER_SECTION
+    return None
+
+def _close_spans(spans: List[SectionSpan], text_length: int) -> List[SectionSpan]:
+    # Unknown headings above the first known one are header lines (the name); leave them in the contact block
+    while spans and spans[0].key == OTHER_SECTION:
+        spans.pop(0)
+    for i, span in enumerate(spans):
+        span.end = spans[i + 1].heading_start if i + 1 < len(spans) else text_length
+    return spans
+
+def read_pdf(file_path: str) -> str:
+    """Extracts text from a PDF file. Raises on malformed input."""
+    return pdfminer.high_level.extract_text(file_path)
+
+def read_docx(file_path: str) -> str:
+    """Extracts text from a DOCX file. Raises on malformed input."""
+    doc = docx.Document(file_path)
+    full_text = []
+    for para in doc.paragraphs:
+        full_text.append(para.text)
+    return '\n'.join(full_text)
+
+def read_pdf_layout(file_path: str) -> ExtractedDocument:
+    """
+    Single walk over pdfminer's layout objects: rebuilds the text (text boxes in top-to-bottom,
+    left-to-right order, so right-aligned dates stay next to their entry) and detects section
+    headings from font size, boldness and position (first line of a text box).
+    Raises on malformed input.
+    """
+    parts = []
+    offset = 0
+    lines = []  # (heading_start, content_start, text, size, bold, first_in_block)
+    sizes = []
+
+    for page in pdfminer.high_level.extract_pages(file_path):
+        boxes = sorted((b for b in page if isinstance(b, LTTextBox)), key=lambda b: (-round(b.y1), b.x0))
+        for box in boxes:
+            first = True
+            for line in box:
+                if not isinstance(line, LTTextLine):
+                    continue
+                line_text = line.get_text()
+                chars = [c for c in line if isinstance(c, LTChar) and not c.get_text().isspace()]
+                if chars:
+                    size = max(c.size for c in chars)
+                    bold = all('bold' in c.fontname.lower() or 'black' in c.fontname.lower() for c in chars)
+                    sizes.extend(c.size for c in chars)
+                    lines.append((offset, offset + len(line_text), line_text, size, bold, first))
+                parts.append(line_text)
+                offset += len(line_text)
+                first = False
+            parts.append("\n")
+            offset += 1
+        parts.append("\f")
+        offset += 1
+
+    text = "".join(parts)
+    body_size = statistics.median(sizes) if sizes else 0
+    spans = []
+    for heading_start, content_start, line_text, size, bold, first in lines:
+        key = classify_heading(line_text, size, bold, body_size, first)
+        if key:
+            spans.append(SectionSpan(key, line_text.strip(), heading_start, content_start, 0))
+    return ExtractedDocument(text, _close_spans(spans, len(text)))
+
+def _docx_paragraphs(doc):
+    """Body paragraphs in document order, including those in table cells, as (paragraph, in_table)."""
+    for block in doc.iter_inner_content():
+        if not isinstance(block, Table):
+            yield block, False
+            continue
+        for row in block.rows:
+            seen = set()
+            for cell in row.cells:
+                # A merged cell is returned once per grid column it spans
+                if id(cell._tc) in seen:
+                    continue
+                seen.add(id(cell._tc))
+                for para in cell.paragraphs:
+                    yield para, True
+
+def read_docx_layout(file_path: str) -> ExtractedDocument:
+    """
+    DOCX counterpart of read_pdf_layout: headings come from Heading/Title styles or all-bold paragraphs.
+    Table cells (entry titles and dates) are part of the text but never headings.
+    """
+    doc = docx.Document(file_path)
+    parts = []
+    offset = 0
+    spans = []
+    for para, in_table in _docx_paragraphs(doc):
+        style = para.style.name if para.style is not None else ""
+        runs = [r for r in para.runs if r.text.strip()]
+        bold = bool(runs) and all(r.bold for r in runs)
+        heading_style = style.startswith("Heading") or style == "Title"
+        # Heading styles count as "larger than body"
+        key = classify_heading(para.text, 2.0 if heading_style else 1.0, bold, 1.0, not in_table)
+        if key:
+            spans.append(SectionSpan(key, para.text.strip(), offset, offset + len(para.text) + 1, 0))
+        parts.append(para.text)
+        offset += len(para.text) + 1
+    text = '\n'.join(parts)
+    return ExtractedDocument(text, _close_spans(spans, len(text)))
+
+def read_document_layout(file_path: str, filename: str) -> ExtractedDocument:
+    """Raising, layout-aware reader for the file extension: text plus detected section spans."""
+    if filename.lower().endswith('.pdf'):
+        return read_pdf_layout(file_path)
+    elif filename.lower().endswith('.docx'):
+        return read_docx_layout(file_path)
+    else:
+        return ExtractedDocument("", [])
 
 def extract_text_from_pdf(file_path: str) -> str:
     """Extracts text from a PDF file."""
     try:
-        text = pdfminer.high_level.extract_text(file_path)
-        return text
+        return read_pdf(file_path)
     except Exception as e:
         print(f"Error reading PDF: {e}")
         return ""
@@ -14,11 +205,7 @@ def extract_text_from_pdf(file_path: str) -> str:
 def extract_text_from_docx(file_path: str) -> str:
     """Extracts text from a DOCX file."""
     try:
-        doc = docx.Document(file_path)
-        full_text = []
-        for para in doc.paragraphs:
-            full_text.append(para.text)
-        return '\n'.join(full_text)
+        return read_docx(file_path)
     except Exception as e:
         print(f"Error reading DOCX: {e}")
         return ""
@@ -31,3 +218,11 @@ def extract_text(file_path: str, filename: str) -> str:
         return extract_text_from_docx(file_path)
     else:
         return ""
+
+def extract_document(file_path: str, filename: str) -> ExtractedDocument:
+    """Layout-aware extract_text: text and section spans, empty on unreadable files."""
+    try:
+        return read_document_layout(file_path, filename)
+    except Exception as e:
+        print(f"Error reading {filename}: {e}")
+        return ExtractedDocument("", [])
@@ -0,0 +1,329 @@
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
+
+from reportlab import rl_config
+from reportlab.lib.pagesizes import LETTER
+from reportlab.lib.units import inch
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+from services.resume_ir import ResumeIR, Entry, build_resume_ir
+from services.output_profile import ProfileCanvas, reports_render_metrics, pdf_options
+
+# Direct-canvas renderer for the fixed single-column template.
+# Mirrors the platypus layout in generator.generate_pdf_resume (same fonts, sizes,
+# frame, spacing and page breaks) but draws text straight onto the canvas: no
+# flowables, no Table layout for right-aligned dates, and word widths are cached.
+#
+# The cursor follows platypus Frame rules: spaceBefore is dropped at the top of a
+# page and collapses into the previous spaceAfter, a Spacer is never dropped, a
+# paragraph splits between lines but never leaves a single line behind, and an
+# entry table splits between its rows.
+
+PAGE_WIDTH, PAGE_HEIGHT = LETTER
+MARGIN = 0.5 * inch
+FRAME_PADDING = 6  # platypus Frame default padding, inside the page margins
+LEFT = MARGIN + FRAME_PADDING
+RIGHT = PAGE_WIDTH - MARGIN - FRAME_PADDING
+TOP = PAGE_HEIGHT - MARGIN - FRAME_PADDING
+BOTTOM = MARGIN + FRAME_PADDING
+FRAME_WIDTH = RIGHT - LEFT
+# Entry tables are 5.5in + 2in wide, wider than the frame; left-aligned, so dates end past RIGHT
+TITLE_COLUMN_WIDTH = 5.5 * inch
+DATE_COLUMN_WIDTH = 2 * inch
+CELL_TOP_PADDING = 3
+EMPTY_CELL_HEIGHT = 12  # a "" cell: one line of the table's default 10pt font
+
+REGULAR = 'Times-Roman'
+BOLD = 'Times-Bold'
+ITALIC = 'Times-Italic'
+
+BODY_SIZE = 10.5
+BODY_LEADING = 13
+DEFAULT_LEADING = 12  # Normal style leading, inherited by the name, contact and section header styles
+BULLET_INDENT = 12
+_FUZZ = 1e-6
+
+# A run of text in a single font: (text, font_name)
+Segment = Tuple[str, str]
+
+
+@lru_cache(maxsize=8192)
+def _width(text: str, font: str, size: float) -> float:
+    return stringWidth(text, font, size)
+
+
+def _wrap(segments: List[Segment], size: float, max_width: float) -> List[List[Segment]]:
+    """
+    Greedy word wrap over mixed-font segments. Returns lines of (word, font) pieces.
+    Like Paragraph, a line may overrun by spaceShrinkage of its spaces; it is squeezed when drawn.
+    """
+    lines: List[List[Segment]] = [[]]
+    line_width = 0.0
+    spaces = 0.0
+    for text, font in segments:
+        space = _width(' ', font, size)
+        for word in text.split():
+            w = _width(word, font, size)
+            if lines[-1] and line_width + space + w > max_width + (spaces + space) * rl_config.spaceShrinkage:
+                lines.append([])
+                line_width = spaces = 0.0
+            if lines[-1]:
+                line_width += space
+                spaces += space
+            lines[-1].append((word, font))
+            line_width += w
+    return lines if lines[0] else []
+
+
+def _line_width(pieces: List[Segment], size: float) -> float:
+    return sum(_width(w, f, size) for w, f in pieces) + sum(_width(' ', f, size) for _, f in pieces[1:])
+
+
+class _CanvasWriter:
+    """Cursor over a reportlab canvas that lays blocks out the way a platypus Frame does."""
+
+    def __init__(self, output_path: str, profile: str):
+        self.c = ProfileCanvas(output_path, pagesize=LETTER, profile=profile, **pdf_options(profile))
+        self._font = None
+        self._reset()
+
+    def _reset(self):
+        self.y = TOP
+        self.at_top = True
+        self.prev_after = 0.0
+
+    def _set_font(self, font: str, size: float):
+        if self._font != (font, size):
+            self.c.setFont(font, size)
+            self._font = (font, size)
+
+    def new_page(self):
+        self.c.showPage()
+        self._font = None  # font state is reset per page
+        self._reset()
+
+    def _space_before(self, before: float) -> float:
+        # Dropped at the top of a page, collapsed into the previous block's spaceAfter otherwise
+        return 0 if self.at_top else max(before - self.prev_after, 0)
+
+    def _available(self, before: float) -> float:
+        return self.y - BOTTOM - self._space_before(before)
+
+    def _fits(self, height: float, before: float) -> bool:
+        available = self._available(before)
+        return available > 0 and available - height >= -_FUZZ
+
+    def _place(self, height: float, before: float, after: float) -> float:
+        """Consumes a block; returns the y of its top edge."""
+        top = self.y - self._space_before(before)
+        if top - height - after != self.y:
+            self.at_top = False
+        self.y = top - height - after
+        self.prev_after = after
+        return top
+
+    def spacer(self, height: float):
+        if not self._fits(height, 0):
+            self.new_page()
+        self._place(height, 0, 0)
+
+    def _draw_line(self, pieces: List[Segment], x: float, y: float, size: float, word_space: float = 0):
+        # One drawString per font run rather than per word
+        start = 0
+        while start < len(pieces):
+            font = pieces[start][1]
+            end = start
+            while end < len(pieces) and pieces[end][1] == font:
+                end += 1
+            if start:
+                x += _width(' ', font, size) + word_space
+            run = ' '.join(word for word, _ in pieces[start:end])
+            self._set_font(font, size)
+            self.c.drawString(x, y, run, wordSpace=word_space or None)
+            x += _width(run, font, size) + word_space * (end - start - 1)
+            start = end
+
+    def _draw_lines(self, lines: List[List[Segment]], top: float, size: float, leading: float,
+                    x: float, width: float, align: str = "left"):
+        # First baseline sits one font size below the top, as in Paragraph
+        for i, pieces in enumerate(lines):
+            line_x = x
+            word_space = 0
+            slack = width - _line_width(pieces, size)
+            if slack < 0 and len(pieces) > 1:  # overrun line: squeeze the spaces to fit
+                word_space = slack / (len(pieces) - 1)
+            elif align != "left":
+                line_x += slack / 2 if align == "center" else slack
+            self._draw_line(pieces, line_x, top - size - i * leading, size, word_space)
+
+    def paragraph(self, segments: List[Segment], size: float = BODY_SIZE, leading: float = BODY_LEADING,
+                  before: float = 0, after: float = 2, x: float = LEFT, width: float = FRAME_WIDTH,
+                  align: str = "left"):
+        """Draws wrapped text, splitting it across pages between lines. Empty text still takes its spacing."""
+        lines = _wrap(segments, size, width)
+        while True:
+            available = self._available(before)
+            fit = int(available / leading) if available > 0 else 0
+            if self._fits(len(lines) * leading, before):
+                chunk = lines
+            elif fit > 1:
+                chunk = lines[:fit]
+            elif self.at_top:
+                chunk = lines[:max(fit, 1)]
+            else:  # nothing, or an orphaned first line: move the paragraph on
+                self.new_page()
+                continue
+            top = self._place(len(chunk) * leading, before, after)
+            self._draw_lines(chunk, top, size, leading, x, width, align)
+            lines = lines[len(chunk):]
+            if not lines:
+                break
+
+    def table(self, rows: List[Tuple[List[Segment], Optional[str]]], bottom_padding: float):
+        """
+        Entry header table: (left cell segments, right-aligned cell text or None) per row.
+        Splits between rows like a platypus Table.
+        """
+        cells = []
+        for left, right in rows:
+            left_lines = _wrap(left, BODY_SIZE, TITLE_COLUMN_WIDTH)
+            right_lines = _wrap([(right, REGULAR)], BODY_SIZE, DATE_COLUMN_WIDTH) if right else []
+            content = max(len(left_lines) * BODY_LEADING, len(right_lines) * BODY_LEADING if right else EMPTY_CELL_HEIGHT)
+            cells.append((left_lines, right_lines, content + CELL_TOP_PADDING + bottom_padding))
+
+        while cells:
+            fit = used = 0
+            for _, _, h in cells:
+                if used + h > self._available(0) + _FUZZ:
+                    break
+                used += h
+                fit += 1
+            if fit:
+                chunk = cells[:fit]
+            elif self.at_top:
+                chunk = cells[:1]
+            else:
+                self.new_page()
+                continue
+            row_top = self._place(sum(h for _, _, h in chunk), 0, 0)
+            for left_lines, right_lines, h in chunk:
+                text_top = row_top - CELL_TOP_PADDING
+                self._draw_lines(left_lines, text_top, BODY_SIZE, BODY_LEADING, LEFT, TITLE_COLUMN_WIDTH)
+                self._draw_lines(right_lines, text_top, BODY_SIZE, BODY_LEADING,
+                                 LEFT + TITLE_COLUMN_WIDTH, DATE_COLUMN_WIDTH, align="right")
+                row_top -= h
+            cells = cells[len(chunk):]
+
+    def rule(self):
+        # HRFlowable(width="100%", thickness=1, spaceBefore=4, spaceAfter=6), stroked along its bottom edge
+        if not self._fits(1, 4):
+            self.new_page()
+        top = self._place(1, 4, 6)
+        self.c.setLineWidth(1)
+        self.c.line(LEFT, top - 1, RIGHT, top - 1)
+
+    def save(self):
+        # Emit the last page even if only a Spacer landed on it, as platypus does
+        if not self.at_top:
+            self.c.showPage()
+        self.c.save()
+
+
+@reports_render_metrics("canvas")
+def generate_pdf_resume_canvas(data: Union[dict, ResumeIR], output_path: str, profile: Optional[str] = None):
+    """
+    Fast-path PDF renderer: same template as generate_pdf_resume, drawn directly on the canvas.
+    Accepts the flat ResumeData dict or an already built ResumeIR.
+    """
+    ir = build_resume_ir(data)
+    w = _CanvasWriter(output_path, profile)
+
+    def section_header(title: str):
+        w.paragraph([(title.upper(), BOLD)], size=11, leading=DEFAULT_LEADING, before=10, after=2)
+        w.rule()
+
+    def entry_header(entry: Entry, bottom_padding: float):
+        if not entry.has_columns:
+            w.paragraph([(entry.title, BOLD)])
+            return
+        rows = [([(entry.title, BOLD)], entry.date)]
+        if entry.subtitle:
+            rows.append(([(entry.subtitle, ITALIC)], None))
+        w.table(rows, bottom_padding)
+
+    def bullets(entry: Entry):
+        # Platypus draws "• text" as one paragraph indented by the bullet style's leftIndent
+        for line in entry.bullets:
+            w.paragraph([("•", REGULAR), (line, REGULAR)], x=LEFT + BULLET_INDENT,
+                        width=FRAME_WIDTH - BULLET_INDENT, after=1)
+
+    # --- HEADER ---
+    w.paragraph([(ir.header.name.upper(), BOLD)], size=24, leading=DEFAULT_LEADING, after=12, align="center")
+    w.paragraph([(ir.header.contact_info, REGULAR)], size=10, leading=DEFAULT_LEADING, before=6, after=12,
+                align="center")
+    w.spacer(10)
+
+    # --- SUMMARY ---
+    if ir.summary:
+        section_header("SUMMARY")
+        w.paragraph([(ir.summary, REGULAR)])
+        w.spacer(12)
+
+    # --- SECTIONS GENERATORS ---
+
+    def generate_education():
+        if ir.education:
+            section_header("EDUCATION")
+            for entry in ir.education:
+                entry_header(entry, 0)
+                w.spacer(4)
+
+    def generate_experience():
+        if ir.experience:
+            section_header("PROFESSIONAL EXPERIENCE")
+            for entry in ir.experience:
+                entry_header(entry, 1)
+                bullets(entry)
+                w.spacer(8)
+
+    def generate_projects():
+        if ir.projects:
+            section_header("PROJECTS")
+            for entry in ir.projects:
+                w.paragraph([(entry.title, BOLD)])
+                bullets(entry)
+                w.spacer(8)
+
+    def generate_skills():
+        if ir.skills:
+            section_header("SKILLS")
+            for skill in ir.skills:
+                if skill.category is not None:
+                    w.paragraph([(skill.category + ":", BOLD), (skill.values, REGULAR)])
+                else:
+                    w.paragraph([(skill.values, REGULAR)])
+            w.spacer(6)
+
+    def generate_course_work():
+        if ir.course_work:
+            section_header("COURSE WORK")
+            for item in ir.course_work:
+                w.paragraph([(item, REGULAR)])
+            w.spacer(6)
+
+    # Dispatch Map
+    generators = {
+        'education': generate_education,
+        'experience': generate_experience,
+        'projects': generate_projects,
+        'skills': generate_skills,
+        'course_work': generate_course_work
+    }
+
+    # Order processing
+    for section in ir.section_order:
+        if section in generators:
+            generators[section]()
+
+    w.save()
+    return output_path
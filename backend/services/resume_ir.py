@@ -0,0 +1,122 @@
+from dataclasses import dataclass
+from typing import List, Optional, Union
+
+DEFAULT_SECTION_ORDER = ["education", "skills", "experience", "projects", "course_work"]
+
+# Compact intermediate representation of a resume.
+# The flat strings coming from Gemini / the editor are parsed once here and
+# every renderer (PDF, DOCX) consumes the same structure, so they can't
+# disagree on how a contact line or an experience header is split.
+
+
+@dataclass
+class Header:
+    __slots__ = ("name", "contact_info")
+    name: str
+    contact_info: str
+
+
+@dataclass
+class Entry:
+    """One education / experience / project block: bold title, optional italic subtitle, right-aligned date, bullets."""
+    __slots__ = ("title", "subtitle", "date", "bullets")
+    title: str
+    subtitle: str
+    date: str
+    bullets: List[str]
+
+    @property
+    def has_columns(self) -> bool:
+        """True if the entry needs the two-column (title | date) layout."""
+        return bool(self.subtitle or self.date)
+
+
+@dataclass
+class SkillCategory:
+    __slots__ = ("category", "values")
+    category: Optional[str]
+    values: str
+
+
+@dataclass
+class ResumeIR:
+    __slots__ = ("header", "summary", "education", "experience", "projects", "skills", "course_work", "section_order")
+    header: Header
+    summary: str
+    education: List[Entry]
+    experience: List[Entry]
+    projects: List[Entry]
+    skills: List[SkillCategory]
+    course_work: List[str]
+    section_order: List[str]
+
+
+def parse_header(contact_line: str) -> Header:
+    """Splits "Name | Phone | Email..." (or newline separated) into name and contact line."""
+    contact_line = (contact_line or "").strip()
+    parts = [p.strip() for p in contact_line.split('|')]
+    if len(parts) > 1:
+        return Header(parts[0], " | ".join(parts[1:]))
+    if '\n' in contact_line:
+        n_parts = [p.strip() for p in contact_line.split('\n')]
+        return Header(n_parts[0], " | ".join(p for p in n_parts[1:] if p))
+    return Header(contact_line, "")
+
+
+def parse_bullets(lines: List[str]) -> List[str]:
+    """Strips "•" / "-" markers and drops blank lines."""
+    bullets = []
+    for line in lines:
+        line = line.strip()
+        if line.startswith('•') or line.startswith('-'):
+            line = line[1:].strip()
+        if line:
+            bullets.append(line)
+    return bullets
+
+
+def parse_education(item: str) -> Entry:
+    """"University, Degree, GPA, Date" -> title=University, subtitle="Degree, GPA", date=Date."""
+    parts = [x.strip() for x in item.split(',')]
+    if len(parts) < 2:
+        return Entry(item.strip(), "", "", [])
+    return Entry(parts[0], ", ".join(parts[1:-1]), parts[-1], [])
+
+
+def parse_experience(block: str) -> Entry:
+    """"Company | Role | Dates\\n• bullet..." -> title=Company, subtitle=Role, date=Dates."""
+    lines = block.split('\n')
+    h_parts = [p.strip() for p in lines[0].split('|')]
+    company = h_parts[0]
+    role = h_parts[1] if len(h_parts) > 1 else ""
+    date = " | ".join(h_parts[2:])
+    return Entry(company, role, date, parse_bullets(lines[1:]))
+
+
+def parse_project(block: str) -> Entry:
+    """Projects keep their whole header line ("Name | Tech Stack") as the title."""
+    lines = block.split('\n')
+    return Entry(lines[0].strip(), "", "", parse_bullets(lines[1:]))
+
+
+def parse_skill(skill_line: str) -> SkillCategory:
+    if ':' in skill_line:
+        cat, val = skill_line.split(':', 1)
+        return SkillCategory(cat.strip(), val.strip())
+    return SkillCategory(None, skill_line.strip())
+
+
+def build_resume_ir(data: Union[dict, ResumeIR]) -> ResumeIR:
+    """Parses the flat ResumeData dict once. Passing an existing ResumeIR returns it unchanged."""
+    if isinstance(data, ResumeIR):
+        return data
+    return ResumeIR(
+        header=parse_header(data.get('contact') or ""),
+        summary=(data.get('summary') or "").strip(),
+        education=[parse_education(e) for e in data.get('education') or [] if e and e.strip()],
+        experience=[parse_experience(e) for e in data.get('experience') or [] if e and e.strip()],
+        projects=[parse_project(p) for p in data.get('projects') or [] if p and p.strip()],
+        skills=[parse_skill(s) for s in data.get('skills') or [] if s and s.strip()],
+        course_work=[c for c in data.get('course_work') or [] if c and c.strip()],
+        section_order=list(data.get('section_order') or DEFAULT_SECTION_ORDER),
+    )
@@ -0,0 +1,204 @@
+import os
+import re
+import json
+from bisect import bisect_right
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# Skills / technology taxonomy matcher for the heuristic (no-Gemini) path.
+# The taxonomy file is compiled once into an Aho-Corasick automaton over lowercased
+# patterns, so a resume is scanned in a single linear pass no matter how many
+# entries and aliases the taxonomy holds.
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "skills_taxonomy.json")
+SKILLS_TAXONOMY_PATH = os.getenv("SKILLS_TAXONOMY_PATH", DEFAULT_TAXONOMY_PATH)
+
+# Very short forms ("C", "R", "Go", "JS") only count inside a list: "Python, Go, Rust"
+SHORT_PATTERN_LENGTH = 2
+LIST_SEPARATORS = set(",;/|:()[]\n\t•·")
+# Ends the sentence / line that gives a common-word skill name its tech context
+SENTENCE_BREAK_RE = re.compile(r"[.!?](?=\s)|\n")
+
+OTHER_CATEGORY = "Other"
+
+
+class SkillTaxonomy:
+    """
+    Aho-Corasick automaton over every skill name and alias.
+
+    Taxonomy file format:
+        {"version": 1, "categories": {"Languages": [
+            {"name": "Go", "aliases": ["golang"], "exact": ["Go"]}, ...]}}
+    `name` and `aliases` match case-insensitively. When `exact` is present the
+    name itself only matches in those exact spellings (for names that are also
+    common words). With `"context": true` the exact spellings are ordinary words
+    as well ("Spring 2020", "Rust belt"); they only count inside a list or in a
+    sentence that names another skill.
+    """
+
+    def __init__(self, taxonomy: dict):
+        # Automaton: goto transitions, failure links, and pattern ids ending at each state
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        # Pattern id -> (length, exact spelling or None, needs tech context, skill id)
+        self._patterns: List[Tuple[int, Optional[str], bool, int]] = []
+        # Skill id -> (canonical name, category)
+        self.skills: List[Tuple[str, str]] = []
+        self.categories: List[str] = list(taxonomy.get("categories", {}))
+
+        for category, entries in taxonomy.get("categories", {}).items():
+            for entry in entries:
+                skill_id = len(self.skills)
+                self.skills.append((entry["name"], category))
+                exact = entry.get("exact")
+                context = bool(entry.get("context"))
+                forms = [(form, None, False) for form in entry.get("aliases", [])]
+                if exact:
+                    forms.extend((form, form, context) for form in exact)
+                else:
+                    forms.append((entry["name"], None, context))
+                for form, spelling, needs_context in forms:
+                    self._add(form.lower(), spelling, needs_context, skill_id)
+        self._build_links()
+
+    @classmethod
+    def from_file(cls, path: str) -> "SkillTaxonomy":
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def _add(self, pattern: str, spelling: Optional[str], needs_context: bool, skill_id: int):
+        if not pattern:
+            return
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append(len(self._patterns))
+        self._patterns.append((len(pattern), spelling, needs_context, skill_id))
+
+    def _build_links(self):
+        # BFS; each state's output list also absorbs its failure state's outputs
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                if state:
+                    f = self._fail[state]
+                    while f and ch not in self._goto[f]:
+                        f = self._fail[f]
+                    self._fail[nxt] = self._goto[f].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    @staticmethod
+    def _is_word_char(ch: str) -> bool:
+        return ch.isalnum() or ch in "+#"
+
+    @staticmethod
+    def _in_list_context(text: str, start: int, end: int) -> bool:
+        i = start - 1
+        while i >= 0 and text[i] == ' ':
+            i -= 1
+        j = end
+        while j < len(text) and text[j] == ' ':
+            j += 1
+        return (i < 0 or text[i] in LIST_SEPARATORS) and (j >= len(text) or text[j] in LIST_SEPARATORS or text[j] == '.')
+
+    def scan(self, text: str) -> List[Tuple[int, int, int]]:
+        """
+        One pass over `text`. Returns non-overlapping (start, end, skill_id) matches,
+        leftmost-longest, respecting word boundaries.
+        """
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # A few characters lowercase to two code points; keep offsets aligned
+            lowered = "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self._patterns
+        candidates = []
+        pending = []  # common-word names outside a list, kept if their sentence names another skill
+        state = 0
+        for i, ch in enumerate(lowered):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for pattern_id in out[state]:
+                length, spelling, needs_context, skill_id = patterns[pattern_id]
+                start, end = i - length + 1, i + 1
+                if start > 0 and self._is_word_char(text[start - 1]) and self._is_word_char(text[start]):
+                    continue
+                if end < len(text) and self._is_word_char(text[end]) and self._is_word_char(text[end - 1]):
+                    continue
+                if end + 1 < len(text) and text[end] == '.' and text[end + 1].isalnum():
+                    continue  # domain / file name: github.com, config.yaml
+                if spelling is not None and text[start:end] != spelling:
+                    continue
+                if (length <= SHORT_PATTERN_LENGTH or needs_context) and not self._in_list_context(text, start, end):
+                    if needs_context:
+                        pending.append((start, end, skill_id))
+                    continue
+                candidates.append((start, end, skill_id))
+
+        if pending and candidates:
+            breaks = [m.end() for m in SENTENCE_BREAK_RE.finditer(text)]
+            with_skills = {bisect_right(breaks, start) for start, _, _ in candidates}
+            candidates.extend(m for m in pending if bisect_right(breaks, m[0]) in with_skills)
+
+        candidates.sort(key=lambda m: (m[0], m[0] - m[1]))
+        matches = []
+        last_end = -1
+        for start, end, skill_id in candidates:
+            if start >= last_end:
+                matches.append((start, end, skill_id))
+                last_end = end
+        return matches
+
+    def categorize(self, text: str) -> "OrderedDict[str, List[str]]":
+        """Category -> canonical skill names, categories in taxonomy order, skills by first mention."""
+        found: Dict[str, List[str]] = {}
+        seen = set()
+        for _, _, skill_id in self.scan(text):
+            if skill_id in seen:
+                continue
+            seen.add(skill_id)
+            name, category = self.skills[skill_id]
+            found.setdefault(category, []).append(name)
+        return OrderedDict((c, found[c]) for c in self.categories if c in found)
+
+
+@lru_cache(maxsize=None)
+def get_skill_taxonomy(path: str = SKILLS_TAXONOMY_PATH) -> SkillTaxonomy:
+    """Compiles the taxonomy file once per process."""
+    return SkillTaxonomy.from_file(path)
+
+
+def extract_skill_lines(text: str, existing: Optional[List[str]] = None) -> List[str]:
+    """
+    Scans the whole resume and returns "Category: a, b" lines as rendered by the generators.
+    Items from `existing` (e.g. a parsed skills section) that the taxonomy doesn't know
+    are kept under the category they were listed under ("Soft: Leadership"), or under
+    "Other" when they had none, rather than dropped.
+    """
+    taxonomy = get_skill_taxonomy()
+    found = taxonomy.categorize(text)
+    # Case-insensitive header -> header as first written
+    headers = {category.lower(): category for category in found}
+
+    for item in existing or []:
+        category, values = item.split(':', 1) if ':' in item else (OTHER_CATEGORY, item)
+        category = headers.setdefault(category.strip().lower(), category.strip() or OTHER_CATEGORY)
+        names = found.setdefault(category, [])
+        for value in values.split(','):
+            value = value.strip()
+            if value and not taxonomy.scan(value) and value not in names:
+                names.append(value)
+    return [f"{category}: {', '.join(names)}" for category, names in found.items() if names]